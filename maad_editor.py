@@ -1,7 +1,24 @@
 import os
+import io
+import re
 import sys
+import html
+import json
+import time
+import zlib
+import shutil
+import tempfile
+import uuid
+import queue
+import hashlib
+import zipfile
+import itertools
+import datetime
 import threading
+import multiprocessing
+import concurrent.futures
 import tkinter as tk
+from collections import namedtuple, OrderedDict, deque
 from tkinter import ttk, filedialog, messagebox, colorchooser, font
 import ctypes
 
@@ -10,6 +27,7 @@ import ctypes
 try:
     from reportlab.pdfgen import canvas
     from reportlab.lib.pagesizes import A4
+    from reportlab.pdfbase.pdfmetrics import stringWidth
     REPORTLAB_OK = True
 except Exception:
     REPORTLAB_OK = False
@@ -34,6 +52,19 @@ def resource_path(relative_path: str) -> str:
     return os.path.join(base_path, relative_path)
 
 
+def user_data_path(filename: str) -> str:
+    """
+    Caminho de um arquivo de dados do usuário (caches), fora da pasta do programa:
+    - Windows: %APPDATA%\\MAAD_Editor
+    - Outros: ~/.maad_editor
+    """
+    if os.environ.get("APPDATA"):
+        base_path = os.path.join(os.environ["APPDATA"], "MAAD_Editor")
+    else:
+        base_path = os.path.join(os.path.expanduser("~"), ".maad_editor")
+    return os.path.join(base_path, filename)
+
+
 def register_font_windows(font_path: str) -> bool:
     """
     Registra fonte (TTF/OTF) no Windows para a sessão atual (não instala no sistema)
@@ -56,6 +87,1342 @@ def register_font_windows(font_path: str) -> bool:
         return False
 
 
+def write_text_file(path: str, content: str):
+    """
+    Grava o texto num arquivo temporário e troca pelo destino no fim,
+    para um salvamento em segundo plano nunca deixar o arquivo pela metade.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+# ---------------- Tarefas em segundo plano ----------------
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+class JobCancelled(Exception):
+    """Levantada dentro de uma tarefa quando o token dela foi cancelado."""
+
+
+class CancelToken:
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise JobCancelled()
+
+
+class Job:
+    """
+    Tarefa enviada ao JobExecutor (também é o "handle" devolvido ao chamador).
+    Tarefas de thread recebem o próprio Job como 1º argumento, para usar
+    job.token e job.progress(); tarefas de processo recebem só os args.
+    """
+
+    def __init__(self, executor, fn, args, kind, priority, name, on_done, on_error, on_progress):
+        self.executor = executor
+        self.fn = fn
+        self.args = args
+        self.kind = kind
+        self.priority = priority
+        self.name = name
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.token = CancelToken()
+        self.done = False
+
+    def cancel(self):
+        self.token.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def progress(self, fraction: float, message: str = ""):
+        if self.on_progress is not None:
+            self.executor._post_progress(self, fraction, message)
+
+
+class JobExecutor:
+    """
+    Executor único para o trabalho em segundo plano do editor:
+    - pool de threads com fila de prioridade (e pool de processos sob demanda)
+    - cancelamento por token e callbacks de progresso
+    - uma só fila de entrega para o thread do Tk, drenada com limite de tempo
+      por ciclo e com progresso agrupado (só o último valor de cada tarefa)
+    """
+
+    def __init__(self, root, workers: int = 4, poll_ms: int = 16, idle_poll_ms: int = 50, budget_ms: int = 8):
+        self._root = root
+        self._poll_ms = poll_ms
+        self._idle_poll_ms = idle_poll_ms
+        self._budget = budget_ms / 1000.0
+
+        self._jobs = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._ui_calls = deque()
+        self._progress = OrderedDict()
+        self._progress_lock = threading.Lock()
+        self._pending = set()
+        self._pending_lock = threading.Lock()
+
+        self._process_pool = None
+        self._closed = False
+
+        self._threads = []
+        for i in range(workers):
+            t = threading.Thread(target=self._worker_loop, name=f"maad-job-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+        self._after_id = self._root.after(self._idle_poll_ms, self._pump)
+
+    # ---- envio ----
+    def submit(self, fn, *args, kind: str = "thread", priority: int = PRIORITY_NORMAL, name: str = "",
+               on_done=None, on_error=None, on_progress=None) -> Job:
+        job = Job(self, fn, args, kind, priority, name or getattr(fn, "__name__", "job"),
+                  on_done, on_error, on_progress)
+        if self._closed:
+            job.cancel()
+            return job
+        with self._pending_lock:
+            self._pending.add(job)
+        self._jobs.put((priority, next(self._seq), job))
+        return job
+
+    def post(self, callback, *args):
+        """
+        Agenda callback(*args) no thread do Tk. Pode ser chamado de qualquer thread.
+        """
+        if callback is not None and not self._closed:
+            self._ui_calls.append((callback, args))
+
+    def _post_progress(self, job, fraction, message):
+        with self._progress_lock:
+            self._progress[job] = (fraction, message)
+
+    # ---- workers ----
+    def _worker_loop(self):
+        while True:
+            _prio, _seq, job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                if job.cancelled:
+                    continue
+                result = self._run(job)
+                if not job.cancelled:
+                    self.post(job.on_done, result)
+            except JobCancelled:
+                pass
+            except Exception as e:
+                if job.on_error is not None:
+                    self.post(job.on_error, e)
+                else:
+                    print(f"Tarefa '{job.name}' falhou:", e)
+            finally:
+                job.done = True
+                with self._pending_lock:
+                    self._pending.discard(job)
+
+    def _run(self, job):
+        if job.kind == "process":
+            future = self._get_process_pool().submit(job.fn, *job.args)
+            while True:
+                try:
+                    return future.result(timeout=0.1)
+                except concurrent.futures.TimeoutError:
+                    if job.cancelled:
+                        future.cancel()
+                        raise JobCancelled()
+        return job.fn(job, *job.args)
+
+    def _get_process_pool(self):
+        if self._process_pool is None:
+            self._process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) - 1))
+        return self._process_pool
+
+    # ---- entrega no thread do Tk ----
+    def _pump(self):
+        self._after_id = None
+        if self._closed:
+            return
+
+        deadline = time.perf_counter() + self._budget
+        busy = False
+
+        with self._progress_lock:
+            progress = list(self._progress.items())
+            self._progress.clear()
+        for job, (fraction, message) in progress:
+            if not job.cancelled:
+                self._call(job.on_progress, (fraction, message))
+            busy = True
+
+        while self._ui_calls and time.perf_counter() < deadline:
+            callback, args = self._ui_calls.popleft()
+            self._call(callback, args)
+            busy = True
+
+        if self._ui_calls:
+            busy = True
+        delay = self._poll_ms if busy else self._idle_poll_ms
+        self._after_id = self._root.after(delay, self._pump)
+
+    def _call(self, callback, args):
+        try:
+            callback(*args)
+        except Exception as e:
+            print("Erro em callback de tarefa:", e)
+
+    # ---- encerramento ----
+    def shutdown(self):
+        self._closed = True
+        with self._pending_lock:
+            for job in self._pending:
+                job.cancel()
+        for _ in self._threads:
+            self._jobs.put((PRIORITY_LOW + 1, next(self._seq), None))
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+
+
+# ---------------- Exportação ----------------
+STYLE_TAGS = ("bold", "italic", "underline")
+
+StyledRun = namedtuple("StyledRun", "text bold italic underline")
+PARAGRAPH_BREAK = StyledRun("\n", False, False, False)
+
+
+def iter_styled_runs(text_widget):
+    """
+    Percorre o documento linha a linha (sem copiar o buffer inteiro):
+    - gera StyledRun(texto, bold, italic, underline) para cada trecho
+    - gera PARAGRAPH_BREAK entre as linhas
+    O dump também corta o texto em tags que não são de estilo (sel, ruler_dim,
+    tts_word...) e em marcas como insert; trechos vizinhos com o mesmo estilo
+    são juntados, para que o resultado dependa só do conteúdo e do estilo.
+    """
+    last_line = int(text_widget.index("end-1c").split(".")[0])
+    for line in range(1, last_line + 1):
+        start = f"{line}.0"
+        active = {t for t in text_widget.tag_names(start) if t in STYLE_TAGS}
+        pending = []
+        pending_style = None
+        for key, value, _index in text_widget.dump(start, f"{line}.end", text=True, tag=True):
+            if key == "tagon" and value in STYLE_TAGS:
+                active.add(value)
+            elif key == "tagoff" and value in STYLE_TAGS:
+                active.discard(value)
+            elif key == "text" and value:
+                style = ("bold" in active, "italic" in active, "underline" in active)
+                if pending and style != pending_style:
+                    yield StyledRun("".join(pending), *pending_style)
+                    pending = []
+                pending.append(value)
+                pending_style = style
+        if pending:
+            yield StyledRun("".join(pending), *pending_style)
+        if line < last_line:
+            yield PARAGRAPH_BREAK
+
+
+def export_runs(runs, writers):
+    """
+    Uma única passada pelo texto alimenta todos os escritores ao mesmo tempo.
+    Se algo falhar, todos os escritores são abortados (temporários apagados).
+    """
+    try:
+        for w in writers:
+            w.begin()
+        for run in runs:
+            if run.text == "\n":
+                for w in writers:
+                    w.end_paragraph()
+            else:
+                for w in writers:
+                    w.write_run(run)
+        for w in writers:
+            w.end_paragraph()
+        for w in writers:
+            w.finish()
+    except Exception:
+        for w in writers:
+            w.abort()
+        raise
+
+
+# Caracteres de controle proibidos no XML 1.0 (ex.: \x0c de texto colado de PDF)
+XML_INVALID_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _xhtml_run(run) -> str:
+    out = html.escape(XML_INVALID_RE.sub("", run.text), quote=False)
+    if run.underline:
+        out = f"<u>{out}</u>"
+    if run.italic:
+        out = f"<em>{out}</em>"
+    if run.bold:
+        out = f"<strong>{out}</strong>"
+    return out
+
+
+def _xml_text(value: str) -> str:
+    return html.escape(XML_INVALID_RE.sub("", value), quote=True)
+
+
+class ExportWriter:
+    """
+    Base dos escritores de exportação.
+    Recebem o fluxo de trechos um a um e gravam direto no arquivo,
+    sem montar a saída inteira em memória.
+    A gravação vai para um temporário ao lado do destino, que só substitui
+    o arquivo escolhido em finish() (como em write_text_file).
+    """
+    extension = ""
+    label = ""
+
+    def __init__(self, path: str, title: str = "Documento"):
+        self.path = path
+        self.title = title
+        self.tmp_path = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+
+    def _commit(self):
+        os.replace(self.tmp_path, self.path)
+
+    def _discard(self):
+        try:
+            os.remove(self.tmp_path)
+        except OSError:
+            pass
+
+    def begin(self):
+        pass
+
+    def write_run(self, run):
+        pass
+
+    def end_paragraph(self):
+        pass
+
+    def finish(self):
+        self._commit()
+
+    def abort(self):
+        self._discard()
+
+
+class HtmlExportWriter(ExportWriter):
+    extension = ".html"
+    label = "HTML"
+
+    def begin(self):
+        self._f = open(self.tmp_path, "w", encoding="utf-8")
+        self._in_par = False
+        self._f.write(
+            "<!DOCTYPE html>\n<html lang=\"pt-BR\">\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{_xml_text(self.title)}</title>\n</head>\n<body>\n"
+        )
+
+    def write_run(self, run):
+        if not self._in_par:
+            self._f.write("<p>")
+            self._in_par = True
+        self._f.write(_xhtml_run(run))
+
+    def end_paragraph(self):
+        self._f.write("</p>\n" if self._in_par else "<p><br></p>\n")
+        self._in_par = False
+
+    def finish(self):
+        self._f.write("</body>\n</html>\n")
+        self._f.close()
+        self._commit()
+
+    def abort(self):
+        try:
+            self._f.close()
+        except Exception:
+            pass
+        self._discard()
+
+
+class EpubExportWriter(ExportWriter):
+    """
+    EPUB 3 com um único capítulo.
+    Os arquivos fixos vão antes; o capítulo é gravado em streaming no zip.
+    """
+    extension = ".epub"
+    label = "EPUB"
+
+    def begin(self):
+        self._zip = zipfile.ZipFile(self.tmp_path, "w", zipfile.ZIP_DEFLATED)
+        self._zip.writestr(zipfile.ZipInfo("mimetype"), "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        self._zip.writestr(
+            "META-INF/container.xml",
+            "<?xml version=\"1.0\" encoding=\"utf-8\"?>\n"
+            "<container version=\"1.0\" xmlns=\"urn:oasis:names:tc:opendocument:xmlns:container\">\n"
+            "<rootfiles><rootfile full-path=\"OEBPS/content.opf\" media-type=\"application/oebps-package+xml\"/>"
+            "</rootfiles>\n</container>\n"
+        )
+        modified = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        self._zip.writestr(
+            "OEBPS/content.opf",
+            "<?xml version=\"1.0\" encoding=\"utf-8\"?>\n"
+            "<package xmlns=\"http://www.idpf.org/2007/opf\" version=\"3.0\" unique-identifier=\"uid\">\n"
+            "<metadata xmlns:dc=\"http://purl.org/dc/elements/1.1/\">\n"
+            f"<dc:identifier id=\"uid\">urn:uuid:{uuid.uuid4()}</dc:identifier>\n"
+            f"<dc:title>{_xml_text(self.title)}</dc:title>\n"
+            "<dc:language>pt-BR</dc:language>\n"
+            f"<meta property=\"dcterms:modified\">{modified}</meta>\n"
+            "</metadata>\n<manifest>\n"
+            "<item id=\"nav\" href=\"nav.xhtml\" media-type=\"application/xhtml+xml\" properties=\"nav\"/>\n"
+            "<item id=\"text\" href=\"text.xhtml\" media-type=\"application/xhtml+xml\"/>\n"
+            "</manifest>\n<spine><itemref idref=\"text\"/></spine>\n</package>\n"
+        )
+        self._zip.writestr(
+            "OEBPS/nav.xhtml",
+            "<?xml version=\"1.0\" encoding=\"utf-8\"?>\n"
+            "<html xmlns=\"http://www.w3.org/1999/xhtml\" xmlns:epub=\"http://www.idpf.org/2007/ops\">\n"
+            f"<head><title>{_xml_text(self.title)}</title></head>\n<body>\n"
+            f"<nav epub:type=\"toc\"><ol><li><a href=\"text.xhtml\">{_xml_text(self.title)}</a></li></ol></nav>\n"
+            "</body>\n</html>\n"
+        )
+        self._f = io.TextIOWrapper(self._zip.open("OEBPS/text.xhtml", "w"), encoding="utf-8")
+        self._in_par = False
+        self._f.write(
+            "<?xml version=\"1.0\" encoding=\"utf-8\"?>\n"
+            "<html xmlns=\"http://www.w3.org/1999/xhtml\" xml:lang=\"pt-BR\">\n"
+            f"<head><title>{_xml_text(self.title)}</title></head>\n<body>\n"
+        )
+
+    def write_run(self, run):
+        if not self._in_par:
+            self._f.write("<p>")
+            self._in_par = True
+        self._f.write(_xhtml_run(run))
+
+    def end_paragraph(self):
+        self._f.write("</p>\n" if self._in_par else "<p><br/></p>\n")
+        self._in_par = False
+
+    def finish(self):
+        self._f.write("</body>\n</html>\n")
+        self._f.close()
+        self._zip.close()
+        self._commit()
+
+    def abort(self):
+        for obj in (getattr(self, "_f", None), getattr(self, "_zip", None)):
+            try:
+                if obj is not None:
+                    obj.close()
+            except Exception:
+                pass
+        self._discard()
+
+
+class DocxExportWriter(ExportWriter):
+    """
+    DOCX mínimo (WordprocessingML).
+    O word/document.xml é gravado em streaming, parágrafo a parágrafo.
+    """
+    extension = ".docx"
+    label = "DOCX"
+
+    def begin(self):
+        self._zip = zipfile.ZipFile(self.tmp_path, "w", zipfile.ZIP_DEFLATED)
+        self._zip.writestr(
+            "[Content_Types].xml",
+            "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>\n"
+            "<Types xmlns=\"http://schemas.openxmlformats.org/package/2006/content-types\">"
+            "<Default Extension=\"rels\" ContentType=\"application/vnd.openxmlformats-package.relationships+xml\"/>"
+            "<Default Extension=\"xml\" ContentType=\"application/xml\"/>"
+            "<Override PartName=\"/word/document.xml\" "
+            "ContentType=\"application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml\"/>"
+            "</Types>\n"
+        )
+        self._zip.writestr(
+            "_rels/.rels",
+            "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>\n"
+            "<Relationships xmlns=\"http://schemas.openxmlformats.org/package/2006/relationships\">"
+            "<Relationship Id=\"rId1\" "
+            "Type=\"http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument\" "
+            "Target=\"word/document.xml\"/>"
+            "</Relationships>\n"
+        )
+        self._f = io.TextIOWrapper(self._zip.open("word/document.xml", "w"), encoding="utf-8")
+        self._in_par = False
+        self._f.write(
+            "<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"yes\"?>\n"
+            "<w:document xmlns:w=\"http://schemas.openxmlformats.org/wordprocessingml/2006/main\"><w:body>"
+        )
+
+    def write_run(self, run):
+        if not self._in_par:
+            self._f.write("<w:p>")
+            self._in_par = True
+        props = ""
+        if run.bold:
+            props += "<w:b/>"
+        if run.italic:
+            props += "<w:i/>"
+        if run.underline:
+            props += "<w:u w:val=\"single\"/>"
+        if props:
+            props = f"<w:rPr>{props}</w:rPr>"
+        self._f.write(f"<w:r>{props}<w:t xml:space=\"preserve\">{_xml_text(run.text)}</w:t></w:r>")
+
+    def end_paragraph(self):
+        self._f.write("</w:p>\n" if self._in_par else "<w:p/>\n")
+        self._in_par = False
+
+    def finish(self):
+        self._f.write("<w:sectPr/></w:body></w:document>\n")
+        self._f.close()
+        self._zip.close()
+        self._commit()
+
+    def abort(self):
+        for obj in (getattr(self, "_f", None), getattr(self, "_zip", None)):
+            try:
+                if obj is not None:
+                    obj.close()
+            except Exception:
+                pass
+        self._discard()
+
+
+PDF_FONTS = {
+    (False, False): "Helvetica",
+    (True, False): "Helvetica-Bold",
+    (False, True): "Helvetica-Oblique",
+    (True, True): "Helvetica-BoldOblique",
+}
+
+
+def layout_pdf_paragraph(runs, max_width: float, font_size: float):
+    """
+    Quebra um parágrafo (lista de StyledRun) em linhas que cabem em max_width.
+    Cada linha é uma lista de fragmentos (x, largura, texto, fonte, sublinhado).
+    Parágrafo vazio vira uma linha vazia (mantém o espaçamento).
+    """
+    lines = []
+    line = []
+    x = 0.0
+
+    def push(text, width, font_name, underline):
+        nonlocal x
+        if line and line[-1][3] == font_name and line[-1][4] == underline:
+            px, pw, ptext, _, _ = line[-1]
+            line[-1] = (px, pw + width, ptext + text, font_name, underline)
+        else:
+            line.append((x, width, text, font_name, underline))
+        x += width
+
+    for run in runs:
+        font_name = PDF_FONTS[(run.bold, run.italic)]
+        for piece in re.split(r"(\s+)", run.text):
+            if not piece:
+                continue
+            width = stringWidth(piece, font_name, font_size)
+            if piece.isspace():
+                # espaço no início de linha quebrada é descartado
+                if line or not lines:
+                    push(piece, width, font_name, run.underline)
+                continue
+            if x + width > max_width and line:
+                lines.append(line)
+                line = []
+                x = 0.0
+            # palavra maior que a linha: corta por caracteres
+            while width > max_width and len(piece) > 1:
+                cut = len(piece)
+                while cut > 1 and stringWidth(piece[:cut], font_name, font_size) > max_width - x:
+                    cut -= 1
+                push(piece[:cut], stringWidth(piece[:cut], font_name, font_size), font_name, run.underline)
+                lines.append(line)
+                line = []
+                x = 0.0
+                piece = piece[cut:]
+                width = stringWidth(piece, font_name, font_size)
+            push(piece, width, font_name, run.underline)
+
+    lines.append(line)
+    return lines
+
+
+class PdfLayoutCache:
+    """
+    Cache do layout do PDF por parágrafo:
+    - chave = hash do conteúdo (texto + estilos) e dos parâmetros de layout
+    - valor = linhas já quebradas, cada uma com sua altura
+    Só os parágrafos alterados são re-diagramados numa nova exportação.
+    """
+
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(runs, params) -> bytes:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(repr(params).encode("utf-8"))
+        for run in runs:
+            h.update(b"\x00%d%d%d" % (run.bold, run.italic, run.underline))
+            h.update(run.text.encode("utf-8", "surrogatepass"))
+        return h.digest()
+
+    def layout(self, runs, max_width: float, font_size: float, leading: float):
+        """
+        Devolve [(linha, altura), ...] do parágrafo, usando o cache quando possível.
+        """
+        key = self.make_key(runs, (max_width, font_size, leading))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        lines = layout_pdf_paragraph(runs, max_width, font_size)
+        entry = [(line, leading) for line in lines]
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+class PdfExportWriter(ExportWriter):
+    """
+    PDF via reportlab.
+    Guarda só o parágrafo atual, faz a quebra de linhas (ou pega do cache)
+    e pagina a partir das alturas das linhas.
+    """
+    extension = ".pdf"
+    label = "PDF"
+
+    margin = 50
+    font_size = 12
+    leading = 16
+
+    def __init__(self, path: str, title: str = "Documento", layout_cache=None):
+        super().__init__(path, title)
+        self.layout_cache = layout_cache
+
+    def begin(self):
+        self._canvas = canvas.Canvas(self.tmp_path, pagesize=A4)
+        self._canvas.setTitle(self.title)
+        self._width, self._height = A4
+        self._max_width = self._width - 2 * self.margin
+        self._y = self._height - self.margin
+        self._runs = []
+
+    def write_run(self, run):
+        self._runs.append(run)
+
+    def end_paragraph(self):
+        if self.layout_cache is not None:
+            entry = self.layout_cache.layout(self._runs, self._max_width, self.font_size, self.leading)
+        else:
+            lines = layout_pdf_paragraph(self._runs, self._max_width, self.font_size)
+            entry = [(line, self.leading) for line in lines]
+        self._runs = []
+        for line, line_height in entry:
+            self._draw_line(line, line_height)
+
+    def _draw_line(self, line, line_height):
+        c = self._canvas
+        if self._y < self.margin:
+            c.showPage()
+            self._y = self._height - self.margin
+        for x, width, text, font_name, underline in line:
+            c.setFont(font_name, self.font_size)
+            c.drawString(self.margin + x, self._y, text)
+            if underline:
+                c.line(self.margin + x, self._y - 1.5, self.margin + x + width, self._y - 1.5)
+        self._y -= line_height
+
+    def finish(self):
+        self._canvas.save()
+        self._commit()
+
+
+EXPORT_WRITERS = [PdfExportWriter, HtmlExportWriter, EpubExportWriter, DocxExportWriter]
+
+# Leitura do Text para a exportação: blocos de linhas por ciclo do Tk,
+# numa fila limitada (o documento nunca fica inteiro em memória).
+EXPORT_CHUNK_LINES = 200
+EXPORT_QUEUE_CHUNKS = 8
+
+
+# ---------------- Estatísticas do documento ----------------
+WORD_RE = re.compile(r"\w+(?:[-'’]\w+)*")
+SENTENCE_SPLIT_RE = re.compile(r"[.!?;:\n]")
+
+
+class DocumentStats:
+    """
+    Contadores do documento (palavras, caracteres, frases).
+    São atualizados por diferença: subtrai o trecho antigo e soma o novo.
+    Frases seguem os mesmos separadores do TTS (. ! ? ; : e quebra de linha),
+    então nenhuma conta atravessa linhas e basta recontar as linhas editadas.
+    """
+
+    def __init__(self):
+        self.words = 0
+        self.chars = 0
+        self.sentences = 0
+
+    def reset(self):
+        self.words = 0
+        self.chars = 0
+        self.sentences = 0
+
+    def add(self, text: str, sign: int = 1):
+        if not text:
+            return
+        self.words += sign * sum(1 for _ in WORD_RE.finditer(text))
+        self.chars += sign * (len(text) - text.count("\n"))
+        self.sentences += sign * sum(1 for piece in SENTENCE_SPLIT_RE.split(text) if WORD_RE.search(piece))
+
+    def reading_minutes(self, words_per_minute: int) -> float:
+        return self.words / max(1, words_per_minute)
+
+
+# Envolve o comando Tcl do Text: insert/delete/replace avisam o Python antes e depois.
+# Feito em Tcl para que erros do widget (ex.: "sel.first" sem seleção) sigam
+# direto para quem chamou, sem passar por callbacks Python.
+TEXT_PROXY_TCL = """
+proc ::maad_text_proxy {orig before after args} {
+    set cmd [lindex $args 0]
+    if {$cmd eq "insert" || $cmd eq "delete" || $cmd eq "replace"} {
+        $before {*}$args
+        set result [$orig {*}$args]
+        $after
+        return $result
+    }
+    return [$orig {*}$args]
+}
+"""
+
+
+# ---------------- Servidor TTS (processo separado) ----------------
+class StubSpeechEngine:
+    """
+    Motor de fala falso (testes / máquinas sem voz):
+    "fala" esperando um tempo proporcional às palavras e gera eventos de palavra.
+    """
+
+    def __init__(self):
+        self.rate = 175
+        self.voice = "stub-pt"
+        self._stop = threading.Event()
+
+    def voices(self):
+        return [("stub-pt", "Stub Português"), ("stub-en", "Stub English")]
+
+    def default_voice(self):
+        return "stub-pt"
+
+    def set_rate(self, rate: int):
+        self.rate = max(1, int(rate))
+
+    def set_voice(self, voice_id: str):
+        self.voice = voice_id
+
+    def reset(self):
+        self._stop.clear()
+
+    def speak(self, text: str, on_word) -> bool:
+        for m in WORD_RE.finditer(text):
+            on_word(m.start(), m.end() - m.start())
+            if self._stop.wait(60.0 / self.rate):
+                return False
+        return True
+
+    def stop(self):
+        self._stop.set()
+
+
+class Pyttsx3SpeechEngine:
+    """
+    pyttsx3 rodando dentro do processo do servidor TTS.
+    """
+
+    def __init__(self):
+        self.engine = pyttsx3.init()
+        self._on_word = None
+        self._interrupted = False
+        self.engine.connect("started-word", self._word_cb)
+
+    def _word_cb(self, name, location, length):
+        if self._interrupted:
+            # stop() chegou antes de runAndWait começar
+            self.engine.stop()
+            return
+        if self._on_word is not None:
+            self._on_word(location, length)
+
+    def voices(self):
+        out = []
+        for v in self.engine.getProperty("voices") or []:
+            name = getattr(v, "name", None) or getattr(v, "id", "voz")
+            out.append((str(v.id), str(name)))
+        return out
+
+    def default_voice(self):
+        voice_id = self.engine.getProperty("voice")
+        return str(voice_id) if voice_id else None
+
+    def set_rate(self, rate: int):
+        self.engine.setProperty("rate", int(rate))
+
+    def set_voice(self, voice_id: str):
+        self.engine.setProperty("voice", voice_id)
+
+    def reset(self):
+        self._interrupted = False
+
+    def speak(self, text: str, on_word) -> bool:
+        if self._interrupted:
+            return False
+        self._on_word = on_word
+        try:
+            self.engine.say(text)
+            self.engine.runAndWait()
+        finally:
+            self._on_word = None
+        return not self._interrupted
+
+    def stop(self):
+        self._interrupted = True
+        try:
+            self.engine.stop()
+        except Exception:
+            pass
+
+
+def make_speech_engine(engine_name: str):
+    if engine_name == "stub":
+        return StubSpeechEngine()
+    return Pyttsx3SpeechEngine()
+
+
+def tts_server_main(conn, engine_name: str):
+    """
+    Processo filho do TTS.
+    Comandos (editor -> servidor): speak, pause, resume, stop, rate, voice, quit.
+    Eventos (servidor -> editor): ready, sentence, word, paused, stopped, finished, error.
+    Um thread lê os comandos e interrompe a frase atual na hora (stop/pause/speak);
+    a interrupção só é limpa pelo laço principal, com a fila de comandos vazia,
+    então um stop que chegue entre duas frases nunca se perde.
+    o laço principal fala uma frase por vez e aplica rate/voz entre frases,
+    sem interromper a leitura.
+    As vozes são enumeradas uma só vez, na subida, e vão junto com "ready".
+    """
+    send_lock = threading.Lock()
+
+    def send(*msg):
+        with send_lock:
+            try:
+                conn.send(msg)
+            except (OSError, EOFError):
+                pass
+
+    try:
+        engine = make_speech_engine(engine_name)
+    except Exception as e:
+        send("error", f"Falha ao iniciar TTS: {e}")
+        return
+
+    commands = queue.Queue()
+
+    def reader():
+        while True:
+            try:
+                cmd = conn.recv()
+            except (EOFError, OSError):
+                cmd = ("quit",)
+            # primeiro enfileira, depois interrompe (ver reset() no laço principal)
+            commands.put(cmd)
+            if cmd[0] in ("speak", "pause", "stop", "quit"):
+                engine.stop()
+            if cmd[0] == "quit":
+                return
+
+    threading.Thread(target=reader, name="maad-tts-commands", daemon=True).start()
+    try:
+        voices, default_voice = engine.voices(), engine.default_voice()
+    except Exception as e:
+        print("Falha ao listar vozes:", e)
+        voices, default_voice = [], None
+    send("ready", voices, default_voice)
+
+    sentences = []
+    idx = 0
+    playing = False
+    paused = False
+
+    while True:
+        try:
+            cmd = commands.get() if (not playing or paused) else commands.get_nowait()
+        except queue.Empty:
+            cmd = None
+
+        if cmd is not None:
+            name = cmd[0]
+            if name == "quit":
+                return
+            elif name == "speak":
+                sentences, idx = list(cmd[1]), int(cmd[2])
+                playing, paused = True, bool(cmd[3]) if len(cmd) > 3 else False
+            elif name == "pause":
+                paused = playing
+                send("paused", idx)
+            elif name == "resume":
+                paused = False
+            elif name == "stop":
+                sentences, idx = [], 0
+                playing, paused = False, False
+                send("stopped")
+            elif name == "rate":
+                engine.set_rate(cmd[1])
+            elif name == "voice":
+                engine.set_voice(cmd[1])
+            continue
+
+        if idx >= len(sentences):
+            playing = False
+            send("finished")
+            continue
+
+        # comando enfileirado antes do reset é tratado acima; um que chegue
+        # depois já encontra a interrupção ligada e corta a frase na hora
+        engine.reset()
+        if not commands.empty():
+            continue
+
+        current = idx
+        send("sentence", current)
+        try:
+            done = engine.speak(sentences[current], lambda loc, length: send("word", current, loc, length))
+        except Exception as e:
+            send("error", f"TTS erro: {e}")
+            done = True
+        if done:
+            idx += 1
+
+
+class TTSClient:
+    """
+    Lado do editor do servidor TTS:
+    - inicia e supervisiona o processo filho (reinicia se cair ou travar)
+    - envia comandos pela Pipe; um thread ouvinte repassa os eventos via `post`
+    - guarda frases/posição/config para retomar depois de um reinício
+    """
+    restart_limit = 5
+    stop_timeout = 1.5
+
+    def __init__(self, engine_name: str, post, on_event):
+        self.engine_name = engine_name
+        self._post = post
+        self._on_event = on_event
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._proc = None
+        self._conn = None
+        self._listener = None
+        self._closing = False
+        self._ready = False
+        self.failed = False
+        self._restarts = 0
+        self._ack_deadline = None
+        self._discard_until_stopped = False
+
+        self._sentences = []
+        self._idx = 0
+        self._playing = False
+        self._paused = False
+        self._rate = None
+        self._voice = None
+
+    def start(self):
+        self._spawn()
+        self._listener = threading.Thread(target=self._listen, name="maad-tts-listener", daemon=True)
+        self._listener.start()
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(target=tts_server_main, args=(child_conn, self.engine_name),
+                                 name="maad-tts", daemon=True)
+        proc.start()
+        child_conn.close()
+        with self._lock:
+            self._proc, self._conn = proc, parent_conn
+            self._ready = False
+
+    def _send(self, *cmd):
+        with self._lock:
+            conn = self._conn
+        try:
+            conn.send(cmd)
+        except (OSError, EOFError, AttributeError):
+            pass  # o ouvinte percebe a queda e reinicia
+
+    # ---- comandos ----
+    def speak(self, sentences, start_idx: int = 0):
+        with self._lock:
+            self._sentences = list(sentences)
+            self._idx = start_idx
+            self._playing, self._paused = True, False
+        self._send("speak", self._sentences, start_idx)
+
+    def pause(self):
+        with self._lock:
+            self._paused = True
+            self._ack_deadline = time.monotonic() + self.stop_timeout
+        self._send("pause")
+
+    def resume(self):
+        with self._lock:
+            self._paused = False
+        self._send("resume")
+
+    def stop(self):
+        with self._lock:
+            self._sentences = []
+            self._playing, self._paused = False, False
+            self._ack_deadline = time.monotonic() + self.stop_timeout
+            self._discard_until_stopped = True
+        self._send("stop")
+
+    def set_rate(self, rate: int):
+        if int(rate) == self._rate:
+            return
+        self._rate = int(rate)
+        self._send("rate", self._rate)
+
+    def set_voice(self, voice_id: str):
+        if voice_id == self._voice:
+            return
+        self._voice = voice_id
+        self._send("voice", voice_id)
+
+    def shutdown(self):
+        self._closing = True
+        self._send("quit")
+        with self._lock:
+            proc = self._proc
+        if proc is not None:
+            proc.join(0.5)
+            self._kill(proc)
+
+    @staticmethod
+    def _kill(proc):
+        """
+        Encerra o processo filho; se nem o terminate resolver (driver travado), mata.
+        """
+        try:
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(1.0)
+            if proc.is_alive():
+                proc.kill()
+                proc.join(1.0)
+        except Exception:
+            pass
+
+    # ---- supervisão ----
+    def _listen(self):
+        while not self._closing:
+            with self._lock:
+                conn, proc = self._conn, self._proc
+            try:
+                if conn.poll(0.2):
+                    self._handle(conn.recv())
+                    continue
+            except (EOFError, OSError):
+                self._restart("conexão perdida")
+                continue
+
+            deadline = self._ack_deadline
+            if deadline is not None and time.monotonic() > deadline:
+                self._restart("motor não respondeu")
+            elif not proc.is_alive():
+                self._restart("processo encerrado")
+
+    def _handle(self, msg):
+        kind = msg[0]
+        with self._lock:
+            # eventos da leitura anterior ainda na Pipe, antes da confirmação do stop
+            if self._discard_until_stopped and kind in ("sentence", "word", "finished"):
+                return
+            if kind == "ready":
+                self._ready = True
+            elif kind == "error" and not self._ready:
+                # o motor nem chegou a iniciar: reiniciar não adianta
+                self.failed = True
+                self._closing = True
+            elif kind == "sentence":
+                self._idx = msg[1]
+            elif kind in ("paused", "stopped"):
+                self._ack_deadline = None
+                if kind == "stopped":
+                    self._discard_until_stopped = False
+            elif kind == "finished":
+                self._playing = False
+            if kind in ("stopped", "finished"):
+                self._restarts = 0
+        self._post(self._on_event, msg)
+
+    def _restart(self, reason: str):
+        if self._closing:
+            return
+        with self._lock:
+            proc, conn = self._proc, self._conn
+            self._ack_deadline = None
+            self._discard_until_stopped = False
+        self._kill(proc)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+        self._restarts += 1
+        if self._restarts > self.restart_limit:
+            self.failed = True
+            self._closing = True
+            self._post(self._on_event, ("error", "O motor de TTS falhou várias vezes e foi desativado."))
+            return
+
+        self._spawn()
+        if self._rate is not None:
+            self._send("rate", self._rate)
+        if self._voice is not None:
+            self._send("voice", self._voice)
+        with self._lock:
+            playing, paused = self._playing, self._paused
+            sentences, idx = self._sentences, self._idx
+        if playing:
+            self._send("speak", sentences, idx, paused)
+        self._post(self._on_event, ("restarted", reason))
+
+
+class VoiceCatalog:
+    """
+    Catálogo de vozes do TTS, indexado pelo rótulo mostrado na interface.
+    Vozes com o mesmo nome (ex.: duas "Microsoft Maria") ganham o id no
+    rótulo, "nome (id)", para que todas possam ser escolhidas.
+    Fica gravado em disco: na próxima sessão a lista aparece na hora,
+    antes mesmo de o servidor TTS terminar de subir.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.voices = []
+        self.default_id = None
+        self.by_label = {}
+
+    def _reindex(self):
+        counts = {}
+        for _id, name in self.voices:
+            counts[name] = counts.get(name, 0) + 1
+        self.by_label = OrderedDict()
+        for voice_id, name in self.voices:
+            label = name if counts[name] == 1 else f"{name} ({voice_id})"
+            self.by_label[label] = voice_id
+
+    def load(self) -> bool:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.voices = [(str(v[0]), str(v[1])) for v in data.get("voices", [])]
+            self.default_id = data.get("default")
+        except Exception:
+            return False
+        self._reindex()
+        return bool(self.voices)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {"voices": [list(v) for v in self.voices], "default": self.default_id}
+        write_text_file(self.path, json.dumps(data, ensure_ascii=False, indent=1))
+
+    def update(self, voices, default_id=None) -> bool:
+        """
+        Troca o catálogo pelo enumerado agora. Devolve True se mudou.
+        """
+        voices = [(str(i), str(n)) for i, n in voices]
+        if voices == self.voices and default_id == self.default_id:
+            return False
+        self.voices = voices
+        self.default_id = default_id
+        self._reindex()
+        return True
+
+    def labels(self):
+        return list(self.by_label)
+
+    def resolve(self, label: str):
+        """
+        Rótulo mostrado na interface -> id da voz ("(padrão)" -> voz padrão do motor).
+        """
+        if label == "(padrão)":
+            return self.default_id
+        return self.by_label.get(label)
+
+
+# ---------------- Abas (documentos) ----------------
+TAB_SPILL_IDLE_SECONDS = 120
+TAB_MAX_RESIDENT = 4
+TAB_SPILL_CHECK_MS = 15000
+
+
+class DocumentTab:
+    """
+    Um documento aberto numa aba: Text próprio, arquivo, estilo,
+    estatísticas e posição do TTS.
+    Quando fica muito tempo inativo, o conteúdo vai para um snapshot
+    compactado em disco (snapshot_path) e o Text fica vazio até a aba voltar.
+    """
+
+    def __init__(self, frame, text, scroll):
+        self.frame = frame
+        self.text = text
+        self.scroll = scroll
+
+        self.current_file = None
+        self.text_modified = False
+
+        self.style = None
+        self.dyslexia_mode_on = False
+        self.normal_snapshot = None
+
+        self.stats = DocumentStats()
+        self.suspend_stats = False
+        self.pending_edit = None
+        self.text_orig = None
+        self.tcl_commands = []
+        # conta edições de texto e de estilo (a exportação confere se o texto mudou)
+        self.edit_seq = 0
+
+        self.tts_state = None
+        self.save_seq = 0
+        self.save_job = None
+        self.save_failed = False
+
+        self.last_active = time.monotonic()
+        self.snapshot_path = None
+        self.spilling = False
+
+    def display_name(self) -> str:
+        return os.path.basename(self.current_file) if self.current_file else "Novo arquivo"
+
+    def tab_title(self) -> str:
+        return self.display_name() + (" *" if self.text_modified else "")
+
+
+def write_tab_snapshot(path: str, snapshot: dict):
+    data = zlib.compress(json.dumps(snapshot, ensure_ascii=False).encode("utf-8"), 6)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def read_tab_snapshot(path: str) -> dict:
+    with open(path, "rb") as f:
+        return json.loads(zlib.decompress(f.read()).decode("utf-8"))
+
+
+# ---------------- Régua de leitura ----------------
+def _index_to_pos(index: str):
+    line, col = index.split(".")
+    return int(line), int(col)
+
+
+def _pos_to_index(pos) -> str:
+    return f"{pos[0]}.{pos[1]}"
+
+
+def _subtract_range(ranges, cut):
+    """
+    Remove o intervalo `cut` de cada intervalo em `ranges`.
+    Intervalos são pares (ini, fim) de posições (linha, coluna), fim exclusivo.
+    """
+    out = []
+    c0, c1 = cut
+    for r0, r1 in ranges:
+        if c1 <= r0 or c0 >= r1:
+            out.append((r0, r1))
+            continue
+        if r0 < c0:
+            out.append((r0, c0))
+        if c1 < r1:
+            out.append((c1, r1))
+    return out
+
+
+def diff_ranges(old, new):
+    """
+    Diferença entre dois conjuntos pequenos de intervalos:
+    devolve (a remover, a adicionar) para ir de `old` para `new`.
+    """
+    to_remove = list(old)
+    for r in new:
+        to_remove = _subtract_range(to_remove, r)
+    to_add = list(new)
+    for r in old:
+        to_add = _subtract_range(to_add, r)
+    return to_remove, to_add
+
+
+def _sentence_spans(text: str, sentences):
+    """
+    Posição (início, fim) de cada frase dentro do texto lido pelo TTS.
+    """
+    spans = []
+    pos = 0
+    for sentence in sentences:
+        start = text.find(sentence, pos)
+        if start < 0:
+            start = pos
+        end = start + len(sentence)
+        spans.append((start, end))
+        pos = end
+    return spans
+
+
 class MAADLikeEditor(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -63,8 +1430,11 @@ class MAADLikeEditor(tk.Tk):
         self.geometry("1150x740")
         self.minsize(900, 600)
 
-        self.current_file = None
-        self.text_modified = False
+        # Abas: cada DocumentTab tem seu Text, arquivo, estilo e posição do TTS
+        self.docs = []
+        self.active_doc = None
+        self.spill_dir = None
+        self._spill_after_id = None
 
         # Estado visual
         self.var_font_family = tk.StringVar(value="Arial")
@@ -75,16 +1445,29 @@ class MAADLikeEditor(tk.Tk):
         self.var_line_spacing = tk.DoubleVar(value=1.2)
         self.var_zoom = tk.IntVar(value=100)
 
-        # Preset dislexia
-        self.dyslexia_mode_on = False
-        self._normal_snapshot = None
+        # Cache de layout do PDF (por parágrafo, vale para a sessão)
+        self.pdf_layout_cache = PdfLayoutCache()
+
+        # Estatísticas do documento (os contadores ficam em cada aba)
+        self._stats_refresh_pending = False
+
+        # Régua de leitura
+        self.reading_ruler_on = False
+        self.var_ruler_unit = tk.StringVar(value="linha")
+        self._ruler_pending = False
+        self._ruler_tts_focus = None
 
         # Pasta de fontes
         self.fonts_dir = resource_path(os.path.join("assets", "fonts"))
 
+        # Tarefas em segundo plano (TTS, salvar, exportar, fontes)
+        self.jobs = JobExecutor(self)
+        self.export_job = None
+        self.export_doc = None
+        self._save_lock = threading.Lock()
+
         # -------- TTS state --------
         self.tts_engine = None
-        self.tts_thread = None
         self.tts_lock = threading.Lock()
 
         self.tts_active = False
@@ -92,6 +1475,10 @@ class MAADLikeEditor(tk.Tk):
 
         self.tts_text = ""
         self.tts_sentences = []
+        self.tts_spans = []
+        self.tts_base_index = "1.0"
+        self._tts_word_range = None
+        self._tts_engine_doc = None
         self.tts_idx = 0
 
         self.var_tts_rate = tk.IntVar(value=175)
@@ -101,16 +1488,76 @@ class MAADLikeEditor(tk.Tk):
         self._build_ui()
         self._bind_shortcuts()
 
-        # Fonts
-        self.opendyslexic_loaded = self.load_fonts_from_assets(show_popup=False)
+        # Fonts (registro em segundo plano)
+        self.opendyslexic_loaded = False
+        self.load_fonts_from_assets(show_popup=False)
 
         # TTS
         self._init_tts_if_possible()
         self._apply_style()
         self._update_tts_buttons()
 
+        self._spill_after_id = self.after(TAB_SPILL_CHECK_MS, self._spill_idle_tabs)
+
+    # ---------------- Active document ----------------
+    @property
+    def text(self):
+        return self.active_doc.text
+
+    @property
+    def current_file(self):
+        return self.active_doc.current_file
+
+    @current_file.setter
+    def current_file(self, value):
+        self.active_doc.current_file = value
+        self._update_tab_label(self.active_doc)
+
+    @property
+    def text_modified(self):
+        return self.active_doc.text_modified
+
+    @text_modified.setter
+    def text_modified(self, value):
+        self._set_modified(self.active_doc, value)
+
+    @property
+    def doc_stats(self):
+        return self.active_doc.stats
+
+    @property
+    def dyslexia_mode_on(self):
+        return self.active_doc.dyslexia_mode_on
+
+    @dyslexia_mode_on.setter
+    def dyslexia_mode_on(self, value):
+        self.active_doc.dyslexia_mode_on = value
+
+    @property
+    def _normal_snapshot(self):
+        return self.active_doc.normal_snapshot
+
+    @_normal_snapshot.setter
+    def _normal_snapshot(self, value):
+        self.active_doc.normal_snapshot = value
+
     # ---------------- Fonts ----------------
-    def load_fonts_from_assets(self, show_popup: bool = True) -> bool:
+    def load_fonts_from_assets(self, show_popup: bool = True, on_done=None):
+        """
+        Registra as fontes de assets/fonts em segundo plano.
+        Ao terminar (no thread do Tk) atualiza a lista e chama on_done(ok).
+        """
+        self.jobs.submit(
+            lambda job: self._register_asset_fonts(),
+            priority=PRIORITY_HIGH, name="fontes",
+            on_done=lambda result: self._on_fonts_registered(result, show_popup, on_done),
+            on_error=lambda e: print("Falha ao carregar fontes:", e),
+        )
+
+    def _register_asset_fonts(self):
+        """
+        Roda fora do thread do Tk: só mexe em arquivos e na API do Windows.
+        """
         os.makedirs(self.fonts_dir, exist_ok=True)
 
         try:
@@ -130,6 +1577,11 @@ class MAADLikeEditor(tk.Tk):
             for p in font_files:
                 ok_any = register_font_windows(p) or ok_any
 
+        return files, font_files, ok_any
+
+    def _on_fonts_registered(self, result, show_popup: bool, on_done=None):
+        files, font_files, ok_any = result
+
         try:
             self.update_idletasks()
         except Exception:
@@ -152,7 +1604,9 @@ class MAADLikeEditor(tk.Tk):
             )
             messagebox.showinfo("Recarregar fontes", msg)
 
-        return bool(od) or ok_any
+        self.opendyslexic_loaded = bool(od) or ok_any
+        if on_done is not None:
+            on_done(self.opendyslexic_loaded)
 
     def _refresh_font_list(self):
         try:
@@ -170,38 +1624,105 @@ class MAADLikeEditor(tk.Tk):
 
     # ---------------- TTS ----------------
     def _init_tts_if_possible(self):
-        if not TTS_OK:
+        """
+        Sobe o servidor TTS num processo separado.
+        MAAD_TTS_ENGINE=stub usa o motor falso (testes / sem voz instalada).
+        """
+        engine_name = os.environ.get("MAAD_TTS_ENGINE", "pyttsx3")
+        if engine_name != "stub" and not TTS_OK:
             self.tts_engine = None
             return
-        try:
-            self.tts_engine = pyttsx3.init()
-            voices = self.tts_engine.getProperty("voices") or []
-            voice_names = ["(padrão)"]
-            for v in voices:
-                name = getattr(v, "name", None) or getattr(v, "id", "voz")
-                voice_names.append(str(name))
-            self.voice_combo["values"] = voice_names
+        self.voice_catalog = VoiceCatalog(user_data_path(f"voices-{engine_name}.json"))
+        if self.voice_catalog.load():
+            self._refresh_voice_combo()
+        try:
+            self.tts_engine = TTSClient(engine_name, post=self.jobs.post, on_event=self._on_tts_event)
+            self.tts_engine.start()
+            self._apply_tts_settings()
+        except Exception as e:
+            self.tts_engine = None
+            print("Falha ao iniciar TTS:", e)
+
+    def _on_tts_event(self, event):
+        """
+        Eventos do servidor TTS, já no thread do Tk.
+        """
+        kind = event[0]
+        if kind in ("sentence", "word", "finished") and self._tts_engine_doc is not self.active_doc:
+            # leitura de outra aba (já pausada na troca)
+            return
+        if kind == "ready":
+            if self.voice_catalog.update(event[1], event[2]):
+                self._refresh_voice_combo()
+                catalog = self.voice_catalog
+                self.jobs.submit(lambda job: catalog.save(), priority=PRIORITY_LOW, name="vozes",
+                                 on_error=lambda e: print("Falha ao gravar catálogo de vozes:", e))
+            self._apply_tts_settings()
+            self._update_tts_buttons()
+        elif kind == "sentence":
+            with self.tts_lock:
+                self.tts_idx = event[1]
+            self._ruler_follow_tts(event[1])
+        elif kind == "word":
+            self._tts_highlight_word(event[1], event[2], event[3])
+        elif kind == "finished":
+            self._tts_finished("TTS: pronto.")
+        elif kind == "restarted":
+            self.status.config(text=f"TTS: motor reiniciado ({event[1]}).")
+        elif kind == "error":
+            print(event[1])
+            if self.tts_engine is not None and self.tts_engine.failed:
+                self.tts_engine = None
+                self._tts_finished("TTS: indisponível.")
+
+    def _tts_finished(self, message: str):
+        with self.tts_lock:
+            self.tts_active = False
+            self.tts_paused = False
+        self._tts_clear_word()
+        self._ruler_clear_tts_focus()
+        self._update_tts_buttons()
+        self.status.config(text=message)
+
+    def _tts_highlight_word(self, idx: int, location: int, length: int):
+        with self.tts_lock:
+            if not self.tts_active or idx >= len(self.tts_spans):
+                return
+            start = self.tts_spans[idx][0] + location
+            base = self.tts_base_index
+        self._tts_clear_word()
+        self._tts_word_range = (self.text.index(f"{base} + {start} chars"),
+                                self.text.index(f"{base} + {start + length} chars"))
+        self.text.tag_add("tts_word", *self._tts_word_range)
+
+    def _tts_clear_word(self):
+        if self._tts_word_range is not None:
+            self.text.tag_remove("tts_word", *self._tts_word_range)
+            self._tts_word_range = None
+
+    def _refresh_voice_combo(self):
+        voice_names = ["(padrão)"] + self.voice_catalog.labels()
+        self.voice_combo["values"] = voice_names
+        if self.var_tts_voice.get() not in voice_names:
             self.var_tts_voice.set("(padrão)")
-            self.tts_engine.setProperty("rate", int(self.var_tts_rate.get()))
-        except Exception as e:
-            self.tts_engine = None
-            print("Falha ao iniciar TTS:", e)
 
     def _apply_tts_settings(self):
+        """
+        Envia velocidade e voz ao servidor TTS (não bloqueia).
+        Durante a leitura, valem a partir da próxima frase.
+        """
         if not self.tts_engine:
             return
         try:
-            self.tts_engine.setProperty("rate", int(self.var_tts_rate.get()))
-            if self.var_tts_voice.get() != "(padrão)":
-                target_name = self.var_tts_voice.get()
-                voices = self.tts_engine.getProperty("voices") or []
-                for v in voices:
-                    name = getattr(v, "name", None) or getattr(v, "id", "")
-                    if str(name) == target_name:
-                        self.tts_engine.setProperty("voice", v.id)
-                        break
-        except Exception as e:
-            print("Erro ao aplicar config TTS:", e)
+            rate = int(self.var_tts_rate.get())
+        except (tk.TclError, ValueError):
+            rate = None
+        # valores fora da faixa aparecem enquanto se digita no Spinbox
+        if rate is not None and 90 <= rate <= 280:
+            self.tts_engine.set_rate(rate)
+        voice_id = self.voice_catalog.resolve(self.var_tts_voice.get())
+        if voice_id is not None:
+            self.tts_engine.set_voice(voice_id)
 
     def _split_sentences(self, text: str):
         seps = [".", "!", "?", "\n", ";", ":"]
@@ -219,84 +1740,81 @@ class MAADLikeEditor(tk.Tk):
             out.append(rest)
         return [s for s in out if s.strip()]
 
-    def _start_tts_thread(self):
-        self._update_tts_buttons()
-        self.tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
-        self.tts_thread.start()
-
-    def _tts_worker(self):
+    def _tts_park(self, doc: DocumentTab):
         """
-        TTS estável:
-        - Divide em frases
-        - Fala 1 frase por vez
-        - Mantém índice (self.tts_idx) para retomar corretamente
+        A aba está saindo: pausa a leitura (se for dela) e guarda a posição na aba.
         """
-        if not self.tts_engine:
-            return
-
-        try:
-            self._apply_tts_settings()
-
-            with self.tts_lock:
-                # gera lista só uma vez, e mantém idx para retomar
-                if not self.tts_sentences:
-                    self.tts_sentences = self._split_sentences(self.tts_text.strip())
-                if self.tts_idx < 0:
-                    self.tts_idx = 0
-
-            while True:
-                with self.tts_lock:
-                    if not self.tts_active:
-                        return
-                    paused = self.tts_paused
-                    idx = self.tts_idx
-                    sentences = self.tts_sentences
-
-                if paused:
-                    threading.Event().wait(0.08)
-                    continue
-
-                if idx >= len(sentences):
-                    break
-
-                sentence = sentences[idx]
-
-                # falar 1 frase por vez (não “morre” na primeira)
-                self.tts_engine.say(sentence)
-                self.tts_engine.runAndWait()
-
-                with self.tts_lock:
-                    self.tts_idx += 1
-
-        except Exception as e:
-            print("TTS erro:", e)
-        finally:
-            with self.tts_lock:
+        with self.tts_lock:
+            state = None
+            if self.tts_active:
+                state = {
+                    "text": self.tts_text,
+                    "base": self.tts_base_index,
+                    "sentences": self.tts_sentences,
+                    "spans": self.tts_spans,
+                    "idx": self.tts_idx,
+                }
+            playing = self.tts_active and not self.tts_paused
+        if playing and self.tts_engine and self._tts_engine_doc is doc:
+            self.tts_engine.pause()
+        doc.tts_state = state
+        self._tts_clear_word()
+        self._ruler_clear_tts_focus()
+
+    def _tts_unpark(self, doc: DocumentTab):
+        """
+        A aba está entrando: restaura a posição de leitura dela (pausada).
+        """
+        state = doc.tts_state
+        doc.tts_state = None
+        with self.tts_lock:
+            if state is None:
                 self.tts_active = False
-                self.tts_paused = False
-            self.after(0, self._update_tts_buttons)
-            self.after(0, lambda: self.status.config(text="TTS: pronto."))
+                self.tts_text = ""
+                self.tts_base_index = "1.0"
+                self.tts_sentences = []
+                self.tts_spans = []
+                self.tts_idx = 0
+            else:
+                self.tts_active = True
+                self.tts_text = state["text"]
+                self.tts_base_index = state["base"]
+                self.tts_sentences = state["sentences"]
+                self.tts_spans = state["spans"]
+                self.tts_idx = state["idx"]
+            self.tts_paused = self.tts_active
+
+    def _start_tts(self, text_value: str, base_index: str):
+        sentences = self._split_sentences(text_value)
+        with self.tts_lock:
+            self.tts_text = text_value
+            self.tts_base_index = base_index
+            self.tts_sentences = sentences
+            self.tts_spans = _sentence_spans(text_value, sentences)
+            self.tts_idx = 0
+            self.tts_active = True
+            self.tts_paused = False
+        self._apply_tts_settings()
+        self._tts_engine_doc = self.active_doc
+        self.tts_engine.speak(sentences, 0)
+        self._update_tts_buttons()
 
     def tts_speak_all(self):
         if not self.tts_engine:
             messagebox.showwarning("TTS", "TTS não está disponível. Instale: pip install pyttsx3")
             return
 
-        text_value = self.text.get("1.0", tk.END).strip()
+        raw = self.text.get("1.0", tk.END)
+        text_value = raw.strip()
         if not text_value:
             messagebox.showinfo("TTS", "Não há texto para ler.")
             return
+        lead = len(raw) - len(raw.lstrip())
+        base_index = self.text.index(f"1.0 + {lead} chars")
 
         self.tts_stop()
-        with self.tts_lock:
-            self.tts_text = text_value
-            self.tts_sentences = []
-            self.tts_idx = 0
-            self.tts_active = True
-            self.tts_paused = False
-
         self.status.config(text="TTS: lendo texto completo…")
-        self._start_tts_thread()
+        self._start_tts(text_value, base_index)
 
     def tts_speak_selection(self):
         if not self.tts_engine:
@@ -304,34 +1822,29 @@ class MAADLikeEditor(tk.Tk):
             return
 
         try:
-            sel = self.text.get("sel.first", "sel.last").strip()
+            raw = self.text.get("sel.first", "sel.last")
+            sel_start = self.text.index("sel.first")
         except tk.TclError:
-            sel = ""
+            raw = ""
+            sel_start = "1.0"
+        sel = raw.strip()
 
         if not sel:
             messagebox.showinfo("TTS", "Selecione um trecho para ler.")
             return
+        lead = len(raw) - len(raw.lstrip())
+        base_index = self.text.index(f"{sel_start} + {lead} chars")
 
         self.tts_stop()
-        with self.tts_lock:
-            self.tts_text = sel
-            self.tts_sentences = []
-            self.tts_idx = 0
-            self.tts_active = True
-            self.tts_paused = False
-
         self.status.config(text="TTS: lendo seleção…")
-        self._start_tts_thread()
+        self._start_tts(sel, base_index)
 
     def tts_pause(self):
         with self.tts_lock:
             if not self.tts_active:
                 return
             self.tts_paused = True
-        try:
-            self.tts_engine.stop()
-        except Exception:
-            pass
+        self.tts_engine.pause()
         self.status.config(text="TTS: pausado.")
         self._update_tts_buttons()
 
@@ -340,6 +1853,13 @@ class MAADLikeEditor(tk.Tk):
             if not self.tts_active:
                 return
             self.tts_paused = False
+            sentences, idx = self.tts_sentences, self.tts_idx
+        if self._tts_engine_doc is self.active_doc:
+            self.tts_engine.resume()
+        else:
+            # o motor (único) estava com outra aba: recomeça daqui
+            self._tts_engine_doc = self.active_doc
+            self.tts_engine.speak(sentences, idx)
         self.status.config(text="TTS: retomando…")
         self._update_tts_buttons()
 
@@ -349,12 +1869,13 @@ class MAADLikeEditor(tk.Tk):
             self.tts_paused = False
             self.tts_idx = 0
             self.tts_sentences = []
+            self.tts_spans = []
             self.tts_text = ""
-        try:
-            if self.tts_engine:
-                self.tts_engine.stop()
-        except Exception:
-            pass
+        if self.tts_engine:
+            self.tts_engine.stop()
+        self._tts_engine_doc = None
+        self._tts_clear_word()
+        self._ruler_clear_tts_focus()
         self.status.config(text="TTS: parado.")
         self._update_tts_buttons()
 
@@ -376,8 +1897,8 @@ class MAADLikeEditor(tk.Tk):
         self.btn_tts_resume.configure(state=("normal" if active and paused else "disabled"))
         self.btn_tts_stop.configure(state=("normal" if active else "disabled"))
 
-        self.rate_spin.configure(state=("disabled" if active and not paused else "normal"))
-        self.voice_combo.configure(state=("disabled" if active and not paused else "readonly"))
+        self.rate_spin.configure(state="normal")
+        self.voice_combo.configure(state="readonly")
 
     # ---------------- UI ----------------
     def _build_ui(self):
@@ -415,6 +1936,7 @@ class MAADLikeEditor(tk.Tk):
         ttk.Button(toolbar, text="Cor fundo", command=self.pick_bg).pack(side=tk.LEFT, padx=4)
 
         ttk.Button(toolbar, text="Modo Dislexia", command=self.toggle_dyslexia_mode).pack(side=tk.LEFT, padx=6)
+        ttk.Button(toolbar, text="Régua", command=self.toggle_reading_ruler).pack(side=tk.LEFT, padx=6)
         ttk.Button(toolbar, text="Recarregar fontes", command=lambda: self.load_fonts_from_assets(show_popup=True))\
             .pack(side=tk.LEFT, padx=6)
 
@@ -474,34 +1996,28 @@ class MAADLikeEditor(tk.Tk):
 
         ttk.Button(toolbar, text="Exportar PDF", command=self.export_pdf).pack(side=tk.LEFT, padx=4)
 
-        # Editor
-        main = ttk.Frame(self)
-        main.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Editor (abas)
+        self.notebook = ttk.Notebook(self)
+        self.notebook.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
-        self.text = tk.Text(
-            main, wrap="word", undo=True,
-            padx=14, pady=12, borderwidth=0, highlightthickness=0
-        )
-        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        statusbar = ttk.Frame(self)
+        statusbar.pack(side=tk.BOTTOM, fill=tk.X)
 
-        scroll = ttk.Scrollbar(main, orient=tk.VERTICAL, command=self.text.yview)
-        scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.text.configure(yscrollcommand=scroll.set)
+        self.status = ttk.Label(statusbar, text="Pronto.", anchor="w", padding=(10, 6))
+        self.status.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
-        self.status = ttk.Label(self, text="Pronto.", anchor="w", padding=(10, 6))
-        self.status.pack(side=tk.BOTTOM, fill=tk.X)
+        self.stats_label = ttk.Label(statusbar, text="", anchor="e", padding=(10, 6))
+        self.stats_label.pack(side=tk.RIGHT)
 
-        self.text.tag_configure("bold")
-        self.text.tag_configure("italic")
-        self.text.tag_configure("underline")
+        self.active_doc = self._create_tab()
+        self.notebook.select(self.active_doc.frame)
 
-        self.text.bind("<<Modified>>", self._on_modified)
+        self.var_tts_rate.trace_add("write", lambda *a: self._schedule_stats_refresh())
+        self.var_tts_rate.trace_add("write", lambda *a: self._on_tts_settings_changed())
+        self._schedule_stats_refresh()
 
     def _on_tts_settings_changed(self):
-        with self.tts_lock:
-            active = self.tts_active and not self.tts_paused
-        if active:
-            return
         self._apply_tts_settings()
 
     def _build_menu(self):
@@ -514,14 +2030,24 @@ class MAADLikeEditor(tk.Tk):
         m_file.add_command(label="Abrir...", accelerator="Ctrl+O", command=self.open_file)
         m_file.add_command(label="Salvar", accelerator="Ctrl+S", command=self.save_file)
         m_file.add_command(label="Salvar como", accelerator="Ctrl+Shift+S", command=self.save_file_as)
+        m_file.add_command(label="Fechar aba", accelerator="Ctrl+W", command=self.close_tab)
         m_file.add_separator()
         m_file.add_command(label="Exportar PDF...", command=self.export_pdf)
+        m_file.add_command(label="Exportar HTML...", command=self.export_html)
+        m_file.add_command(label="Exportar EPUB...", command=self.export_epub)
+        m_file.add_command(label="Exportar DOCX...", command=self.export_docx)
+        m_file.add_command(label="Exportar todos os formatos...", command=self.export_all_formats)
         m_file.add_separator()
         m_file.add_command(label="Sair", command=self.on_exit)
 
         m_acc = tk.Menu(menubar, tearoff=False)
         menubar.add_cascade(label="Acessibilidade", menu=m_acc)
         m_acc.add_command(label="Alternar Modo Dislexia", command=self.toggle_dyslexia_mode)
+        m_acc.add_command(label="Alternar Régua de Leitura", command=self.toggle_reading_ruler)
+        m_acc.add_radiobutton(label="Régua: linha atual", value="linha",
+                              variable=self.var_ruler_unit, command=self._schedule_ruler_update)
+        m_acc.add_radiobutton(label="Régua: frase atual", value="frase",
+                              variable=self.var_ruler_unit, command=self._schedule_ruler_update)
         m_acc.add_command(label="Recarregar fontes", command=lambda: self.load_fonts_from_assets(show_popup=True))
 
         m_tts = tk.Menu(menubar, tearoff=False)
@@ -542,6 +2068,7 @@ class MAADLikeEditor(tk.Tk):
         self.bind("<Control-o>", lambda e: self.open_file())
         self.bind("<Control-s>", lambda e: self.save_file())
         self.bind("<Control-Shift-S>", lambda e: self.save_file_as())
+        self.bind("<Control-w>", lambda e: self.close_tab())
 
         self.bind("<F5>", lambda e: self.tts_speak_all())
         self.bind("<F6>", lambda e: self.tts_speak_selection())
@@ -552,11 +2079,354 @@ class MAADLikeEditor(tk.Tk):
         self.protocol("WM_DELETE_WINDOW", self.on_exit)
 
     # ---------------- Editor behaviors ----------------
-    def _on_modified(self, event=None):
-        if self.text.edit_modified():
-            self.text_modified = True
+    def _on_modified(self, doc: DocumentTab):
+        if doc.text.edit_modified():
+            self._set_modified(doc, True)
             self.status.config(text="Editando… (não salvo)")
-            self.text.edit_modified(False)
+            doc.text.edit_modified(False)
+
+    # ---------------- Tabs ----------------
+    def _create_tab(self) -> DocumentTab:
+        frame = ttk.Frame(self.notebook)
+        text = tk.Text(
+            frame, wrap="word", undo=True,
+            padx=14, pady=12, borderwidth=0, highlightthickness=0
+        )
+        text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        scroll = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=text.yview)
+        scroll.pack(side=tk.RIGHT, fill=tk.Y)
+
+        doc = DocumentTab(frame, text, scroll)
+        text.configure(yscrollcommand=lambda first, last: self._on_text_yscroll(doc, first, last))
+
+        text.tag_configure("bold")
+        text.tag_configure("italic")
+        text.tag_configure("underline")
+
+        text.tag_configure("ruler_dim")
+        text.tag_configure("tts_word", background="#fff2a8")
+
+        self._install_text_proxy(doc)
+
+        text.bind("<<Modified>>", lambda e: self._on_modified(doc))
+        text.bind("<KeyPress>", lambda e: self._schedule_ruler_update(), add="+")
+        text.bind("<ButtonRelease-1>", lambda e: self._schedule_ruler_update(), add="+")
+        text.bind("<Configure>", lambda e: self._schedule_ruler_update(), add="+")
+
+        self.docs.append(doc)
+        self.notebook.add(frame, text=doc.tab_title())
+        return doc
+
+    def new_tab(self) -> DocumentTab:
+        old = self.active_doc
+        doc = self._create_tab()
+        # a aba nova herda o estilo atual (inclusive o modo dislexia)
+        doc.dyslexia_mode_on = old.dyslexia_mode_on
+        doc.normal_snapshot = old.normal_snapshot
+        self._activate_tab(doc)
+        return doc
+
+    def _activate_tab(self, doc: DocumentTab):
+        self.notebook.select(doc.frame)
+        self._on_tab_changed()
+
+    def _on_tab_changed(self, event=None):
+        """
+        Troca de aba: guarda estilo e TTS da aba que sai, recarrega a que entra
+        (se estava em disco) e aplica o estilo dela.
+        """
+        selected = self.notebook.select()
+        doc = next((d for d in self.docs if str(d.frame) == selected), None)
+        if doc is None or doc is self.active_doc:
+            return
+
+        old = self.active_doc
+        if old is not None and old in self.docs:
+            old.style = self._capture_style()
+            self._tts_park(old)
+            old.last_active = time.monotonic()
+
+        self.active_doc = doc
+        if doc.snapshot_path is not None:
+            self._restore_tab(doc)
+        doc.last_active = time.monotonic()
+
+        if doc.style is not None:
+            self._load_style(doc.style)
+        self._tts_unpark(doc)
+
+        self._apply_style()
+        self._update_title()
+        self._schedule_stats_refresh()
+        self._update_tts_buttons()
+        doc.text.focus_set()
+
+    def close_tab(self):
+        doc = self.active_doc
+        if not self._confirm_save_if_modified():
+            return
+        if self._tts_engine_doc is doc:
+            self.tts_stop()
+            self._tts_engine_doc = None
+        if self.export_doc is doc and self.export_job is not None:
+            self.export_job.cancel()
+            self.export_doc = None
+
+        self.active_doc = None
+        self.docs.remove(doc)
+        if doc.snapshot_path is not None:
+            try:
+                os.remove(doc.snapshot_path)
+            except OSError:
+                pass
+        widget = doc.text._w
+        self.notebook.forget(doc.frame)
+        doc.frame.destroy()
+        try:
+            self.tk.call("rename", widget, "")
+        except tk.TclError:
+            pass
+        for name in doc.tcl_commands:
+            self.deletecommand(name)
+
+        if not self.docs:
+            self._create_tab()
+        selected = self.notebook.select()
+        self._activate_tab(next((d for d in self.docs if str(d.frame) == selected), self.docs[-1]))
+
+    def _capture_style(self) -> dict:
+        return {
+            "font": self.var_font_family.get(),
+            "size": int(self.var_font_size.get()),
+            "fg": self.var_fg.get(),
+            "bg": self.var_bg.get(),
+            "wrap": bool(self.var_wrap.get()),
+            "spacing": float(self.var_line_spacing.get()),
+            "zoom": int(self.var_zoom.get()),
+        }
+
+    def _load_style(self, style: dict):
+        self.var_font_family.set(style["font"])
+        self.var_font_size.set(style["size"])
+        self.var_fg.set(style["fg"])
+        self.var_bg.set(style["bg"])
+        self.var_wrap.set(style["wrap"])
+        self.var_line_spacing.set(style["spacing"])
+        self.var_zoom.set(style["zoom"])
+
+    def _set_modified(self, doc: DocumentTab, value: bool):
+        if doc.text_modified == value:
+            return
+        doc.text_modified = value
+        self._update_tab_label(doc)
+
+    def _update_tab_label(self, doc: DocumentTab):
+        if doc in self.docs:
+            self.notebook.tab(doc.frame, text=doc.tab_title())
+        if doc is self.active_doc:
+            self._update_title()
+
+    def _update_title(self):
+        self.title(f"MAAD Editor (Python) - {self.active_doc.display_name()}")
+
+    # ---- spill para disco ----
+    def _spill_idle_tabs(self):
+        """
+        Periodicamente manda para disco as abas inativas há mais de
+        TAB_SPILL_IDLE_SECONDS e as que passam de TAB_MAX_RESIDENT abas carregadas.
+        """
+        now = time.monotonic()
+        # a aba sendo exportada ainda está sendo lida aos blocos
+        exporting = self.export_doc if self.export_job is not None and not self.export_job.done else None
+        resident = [
+            d for d in self.docs
+            if d is not self.active_doc and d is not exporting and d.snapshot_path is None and not d.spilling
+        ]
+        resident.sort(key=lambda d: d.last_active)
+        excess = len(resident) - (TAB_MAX_RESIDENT - 1)
+        for i, doc in enumerate(resident):
+            if i < excess or now - doc.last_active > TAB_SPILL_IDLE_SECONDS:
+                self._spill_tab(doc)
+        self._spill_after_id = self.after(TAB_SPILL_CHECK_MS, self._spill_idle_tabs)
+
+    def _spill_tab(self, doc: DocumentTab):
+        text = doc.text
+        if text.compare("end-1c", "==", "1.0"):
+            return
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="maad_abas_")
+
+        snapshot = {
+            "text": text.get("1.0", "end-1c"),
+            "tags": {tag: [str(i) for i in text.tag_ranges(tag)] for tag in STYLE_TAGS},
+            "insert": text.index("insert"),
+            "yview": text.yview()[0],
+        }
+        path = os.path.join(self.spill_dir, f"aba-{uuid.uuid4().hex}.json.z")
+        # se a aba for ativada ou editada antes do fim da gravação, o snapshot fica velho
+        stamp = (doc.last_active, doc.edit_seq)
+        doc.spilling = True
+        self.jobs.submit(
+            lambda job: write_tab_snapshot(path, snapshot),
+            priority=PRIORITY_LOW, name="spill",
+            on_done=lambda _: self._on_tab_spilled(doc, path, stamp),
+            on_error=lambda e: self._on_tab_spill_failed(doc, e),
+        )
+
+    def _on_tab_spilled(self, doc: DocumentTab, path: str, stamp):
+        doc.spilling = False
+        if doc is self.active_doc or doc not in self.docs or stamp != (doc.last_active, doc.edit_seq):
+            # voltou a ser usada (ou foi fechada) enquanto gravava: snapshot descartado
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return
+        doc.suspend_stats = True
+        try:
+            doc.text.delete("1.0", tk.END)
+            doc.text.edit_reset()
+            doc.text.edit_modified(False)
+        finally:
+            doc.suspend_stats = False
+        doc.snapshot_path = path
+
+    def _on_tab_spill_failed(self, doc: DocumentTab, error):
+        doc.spilling = False
+        print("Falha ao gravar snapshot da aba:", error)
+
+    def _restore_tab(self, doc: DocumentTab):
+        """
+        Recarrega o conteúdo de uma aba que estava em disco.
+        O histórico de desfazer não sobrevive ao snapshot.
+        Se a leitura falhar, a aba fica bloqueada (somente leitura, sem salvar)
+        e o snapshot é mantido; nova tentativa na próxima ativação.
+        """
+        text = doc.text
+        try:
+            snapshot = read_tab_snapshot(doc.snapshot_path)
+        except Exception as e:
+            text.configure(state="disabled")
+            messagebox.showerror(
+                "Abas",
+                f"Não foi possível recarregar a aba: {e}\n"
+                "A aba fica bloqueada para não sobrescrever o arquivo com um texto vazio."
+            )
+            return
+        text.configure(state="normal")
+        doc.suspend_stats = True
+        try:
+            text.insert("1.0", snapshot["text"])
+            for tag, indices in snapshot["tags"].items():
+                for i in range(0, len(indices), 2):
+                    text.tag_add(tag, indices[i], indices[i + 1])
+            text.edit_reset()
+            text.edit_modified(False)
+        finally:
+            doc.suspend_stats = False
+        text.mark_set("insert", snapshot["insert"])
+        text.yview_moveto(snapshot["yview"])
+        try:
+            os.remove(doc.snapshot_path)
+        except OSError:
+            pass
+        doc.snapshot_path = None
+
+    # ---------------- Document stats ----------------
+    def _install_text_proxy(self, doc: DocumentTab):
+        """
+        Renomeia o comando do Text e põe o proxy Tcl no lugar.
+        Undo/redo do Tk chamam o widget pelo nome, então também passam pelo proxy.
+        """
+        widget = doc.text._w
+        orig = widget + "_orig"
+        if not int(self.tk.eval("llength [info procs ::maad_text_proxy]")):
+            self.tk.eval(TEXT_PROXY_TCL)
+        before = self.register(lambda *args: self._stats_before_edit(doc, *args))
+        after = self.register(lambda: self._stats_after_edit(doc))
+        self.tk.call("rename", widget, orig)
+        self.tk.call("interp", "alias", "", widget, "", "::maad_text_proxy", orig, before, after)
+        doc.text_orig = orig
+        doc.tcl_commands = [before, after]
+
+    def _text_last_line(self, doc: DocumentTab) -> int:
+        return int(str(self.tk.call(doc.text_orig, "index", "end-1c")).split(".")[0])
+
+    def _edit_line_range(self, doc: DocumentTab, args):
+        """
+        Linhas tocadas por um insert/delete/replace (antes da edição).
+        """
+        cmd = args[0]
+        if cmd == "insert":
+            indices = [args[1]]
+        elif cmd == "delete":
+            indices = list(args[1:])
+            # índice sem par apaga um caractere; se for a quebra de linha,
+            # a linha seguinte se junta a esta e também precisa ser contada
+            if len(indices) % 2:
+                indices.append(f"{indices[-1]} + 1c")
+        else:
+            indices = [args[1], args[2]]
+        lines = [int(str(self.tk.call(doc.text_orig, "index", i)).split(".")[0]) for i in indices]
+        last = self._text_last_line(doc)
+        return min(min(lines), last), min(max(lines), last), last
+
+    def _stats_before_edit(self, doc: DocumentTab, *args):
+        doc.edit_seq += 1
+        # spill/reload da aba não mexem nos contadores
+        if doc.suspend_stats:
+            doc.pending_edit = None
+            return
+        try:
+            l0, l1, last = self._edit_line_range(doc, args)
+            old = self.tk.call(doc.text_orig, "get", f"{l0}.0", f"{l1}.end")
+        except Exception:
+            doc.pending_edit = None
+            return
+        doc.stats.add(str(old), -1)
+        doc.pending_edit = (l0, l1, last)
+
+    def _stats_after_edit(self, doc: DocumentTab):
+        pending = doc.pending_edit
+        doc.pending_edit = None
+        if pending is None:
+            return
+        l0, l1, old_last = pending
+        try:
+            # linhas depois de l1 só se deslocaram; a região editada agora vai até l1 + delta
+            new_last = self._text_last_line(doc)
+            end = max(l0, min(new_last, l1 + new_last - old_last))
+            new = self.tk.call(doc.text_orig, "get", f"{l0}.0", f"{end}.end")
+        except Exception:
+            return
+        doc.stats.add(str(new), +1)
+        if doc is self.active_doc:
+            self._schedule_stats_refresh()
+
+    def _schedule_stats_refresh(self):
+        if self._stats_refresh_pending:
+            return
+        self._stats_refresh_pending = True
+        self.after_idle(self._refresh_stats_label)
+
+    def _refresh_stats_label(self):
+        self._stats_refresh_pending = False
+        st = self.doc_stats
+        try:
+            rate = int(self.var_tts_rate.get())
+        except (tk.TclError, ValueError):
+            rate = 175
+        minutes = st.reading_minutes(rate)
+        reading = "< 1 min" if minutes < 1 else f"~{round(minutes)} min"
+
+        def fmt(n):
+            return f"{n:,}".replace(",", ".")
+
+        self.stats_label.config(
+            text=f"Palavras: {fmt(st.words)} | Caracteres: {fmt(st.chars)} | "
+                 f"Frases: {fmt(st.sentences)} | Leitura: {reading}"
+        )
 
     def _apply_style(self):
         base_size = int(self.var_font_size.get())
@@ -581,28 +2451,22 @@ class MAADLikeEditor(tk.Tk):
         self.text.tag_configure("bold", font=(family, size, "bold"))
         self.text.tag_configure("italic", font=(family, size, "italic"))
         self.text.tag_configure("underline", font=(family, size, "underline"))
+        self.text.tag_configure("ruler_dim", foreground=self._blend_color(fg, bg, 0.7))
+        self.text.tag_raise("ruler_dim")
+        self._schedule_ruler_update()
 
         self.status.config(text=f"Fonte: {family} | {size}px | Espaço {self.var_line_spacing.get():.1f} | Zoom {zoom}%")
 
     def toggle_dyslexia_mode(self):
         if not self.dyslexia_mode_on:
-            self._normal_snapshot = {
-                "font": self.var_font_family.get(),
-                "size": int(self.var_font_size.get()),
-                "fg": self.var_fg.get(),
-                "bg": self.var_bg.get(),
-                "wrap": bool(self.var_wrap.get()),
-                "spacing": float(self.var_line_spacing.get()),
-                "zoom": int(self.var_zoom.get()),
-            }
+            self._normal_snapshot = self._capture_style()
 
             od = self._pick_opendyslexic_family()
-            if not od:
-                self.load_fonts_from_assets(show_popup=False)
-                od = self._pick_opendyslexic_family()
-
             if od:
                 self.var_font_family.set(od)
+            else:
+                # fonte ainda não registrada: aplica quando o carregamento terminar
+                self.load_fonts_from_assets(show_popup=False, on_done=lambda ok: self._use_dyslexia_font())
 
             self.var_font_size.set(max(16, int(self.var_font_size.get())))
             self.var_line_spacing.set(1.6)
@@ -616,18 +2480,124 @@ class MAADLikeEditor(tk.Tk):
             self.status.config(text="Modo Dislexia: ATIVADO")
         else:
             if self._normal_snapshot:
-                self.var_font_family.set(self._normal_snapshot["font"])
-                self.var_font_size.set(self._normal_snapshot["size"])
-                self.var_fg.set(self._normal_snapshot["fg"])
-                self.var_bg.set(self._normal_snapshot["bg"])
-                self.var_wrap.set(self._normal_snapshot["wrap"])
-                self.var_line_spacing.set(self._normal_snapshot["spacing"])
-                self.var_zoom.set(self._normal_snapshot["zoom"])
+                self._load_style(self._normal_snapshot)
 
             self.dyslexia_mode_on = False
             self._apply_style()
             self.status.config(text="Modo Dislexia: DESATIVADO")
 
+    def _use_dyslexia_font(self):
+        if not self.dyslexia_mode_on:
+            return
+        od = self._pick_opendyslexic_family()
+        if od:
+            self.var_font_family.set(od)
+            self._apply_style()
+
+    # ---------------- Reading ruler ----------------
+    def toggle_reading_ruler(self):
+        self.reading_ruler_on = not self.reading_ruler_on
+        if self.reading_ruler_on:
+            self._update_reading_ruler()
+            self.status.config(text="Régua de leitura: ATIVADA")
+        else:
+            self._clear_reading_ruler()
+            self.status.config(text="Régua de leitura: DESATIVADA")
+
+    def _clear_reading_ruler(self):
+        for doc in self.docs:
+            ranges = doc.text.tag_ranges("ruler_dim")
+            for i in range(0, len(ranges), 2):
+                doc.text.tag_remove("ruler_dim", ranges[i], ranges[i + 1])
+
+    def _blend_color(self, fg: str, bg: str, amount: float) -> str:
+        """
+        Mistura fg com bg (amount=1.0 -> bg). Usado para o texto "apagado" da régua.
+        """
+        try:
+            r1, g1, b1 = self.winfo_rgb(fg)
+            r2, g2, b2 = self.winfo_rgb(bg)
+        except tk.TclError:
+            return "#999999"
+        mix = [int((a + (b - a) * amount) / 257) for a, b in ((r1, r2), (g1, g2), (b1, b2))]
+        return "#%02x%02x%02x" % tuple(mix)
+
+    def _on_text_yscroll(self, doc: DocumentTab, first, last):
+        doc.scroll.set(first, last)
+        if doc is self.active_doc:
+            self._schedule_ruler_update()
+
+    def _schedule_ruler_update(self):
+        if not self.reading_ruler_on or self._ruler_pending:
+            return
+        self._ruler_pending = True
+        self.after_idle(self._update_reading_ruler)
+
+    def _ruler_focus_range(self):
+        """
+        Trecho em destaque: frase lida pelo TTS, ou linha/frase do cursor.
+        """
+        if self._ruler_tts_focus:
+            return self._ruler_tts_focus
+
+        if self.var_ruler_unit.get() == "frase":
+            start = self.text.search(r"[.!?;:]", "insert", stopindex="insert linestart",
+                                     backwards=True, regexp=True)
+            start = self.text.index(f"{start} + 1c") if start else self.text.index("insert linestart")
+            end = self.text.search(r"[.!?;:]", "insert", stopindex="insert lineend", regexp=True)
+            end = self.text.index(f"{end} + 1c") if end else self.text.index("insert lineend")
+            return start, end
+
+        return self.text.index("insert display linestart"), self.text.index("insert display lineend")
+
+    def _update_reading_ruler(self):
+        """
+        Aplica a régua só na parte visível do texto.
+        Compara com os intervalos já apagados e mexe apenas na diferença.
+        """
+        self._ruler_pending = False
+        if not self.reading_ruler_on:
+            return
+
+        # limites de linha de exibição: com quebra de linha, um parágrafo longo
+        # no topo ou no fim da tela não estende a régua para fora da área visível
+        vis_start = _index_to_pos(self.text.index("@0,0 display linestart"))
+        vis_end = _index_to_pos(self.text.index(f"@0,{self.text.winfo_height()} display lineend"))
+        focus_start, focus_end = (_index_to_pos(i) for i in self._ruler_focus_range())
+
+        new = _subtract_range([(vis_start, vis_end)], (focus_start, focus_end))
+        new = [r for r in new if r[0] < r[1]]
+
+        # a tag só existe na área visível, então tag_ranges é pequeno
+        ranges = self.text.tag_ranges("ruler_dim")
+        old = [(_index_to_pos(str(ranges[i])), _index_to_pos(str(ranges[i + 1])))
+               for i in range(0, len(ranges), 2)]
+
+        to_remove, to_add = diff_ranges(old, new)
+        for a, b in to_remove:
+            self.text.tag_remove("ruler_dim", _pos_to_index(a), _pos_to_index(b))
+        for a, b in to_add:
+            self.text.tag_add("ruler_dim", _pos_to_index(a), _pos_to_index(b))
+
+    def _ruler_follow_tts(self, idx: int):
+        with self.tts_lock:
+            if not self.tts_active or idx >= len(self.tts_spans):
+                return
+            a, b = self.tts_spans[idx]
+            base = self.tts_base_index
+        start = self.text.index(f"{base} + {a} chars")
+        end = self.text.index(f"{base} + {b} chars")
+        self._ruler_tts_focus = (start, end)
+        if self.reading_ruler_on:
+            self.text.see(start)
+            self._schedule_ruler_update()
+
+    def _ruler_clear_tts_focus(self):
+        if self._ruler_tts_focus is None:
+            return
+        self._ruler_tts_focus = None
+        self._schedule_ruler_update()
+
     def _toggle_tag_on_selection(self, tag):
         try:
             start = self.text.index("sel.first")
@@ -636,6 +2606,7 @@ class MAADLikeEditor(tk.Tk):
             messagebox.showinfo("Seleção", "Selecione um trecho primeiro.")
             return
 
+        self.active_doc.edit_seq += 1
         if self.text.tag_nextrange(tag, start, end):
             self.text.tag_remove(tag, start, end)
         else:
@@ -670,55 +2641,124 @@ class MAADLikeEditor(tk.Tk):
         if ans is None:
             return False
         if ans is True:
-            return self.save_file()
+            return self.save_file(wait=True)
         return True
 
     def new_file(self):
-        if not self._confirm_save_if_modified():
-            return
-        self.text.delete("1.0", tk.END)
-        self.current_file = None
-        self.text_modified = False
-        self.title("MAAD Editor (Python) - Novo arquivo")
+        self.new_tab()
         self.status.config(text="Novo arquivo.")
 
-    def open_file(self):
-        if not self._confirm_save_if_modified():
-            return
+    def _active_tab_is_blank(self) -> bool:
+        doc = self.active_doc
+        return (doc.current_file is None and not doc.text_modified and doc.snapshot_path is None
+                and doc.text.compare("end-1c", "==", "1.0"))
 
+    def open_file(self):
         path = filedialog.askopenfilename(
             title="Abrir arquivo",
             filetypes=[("Texto", "*.txt"), ("Todos", "*.*")]
         )
         if not path:
             return
+
+        # já aberto numa aba: só ativa
+        for doc in self.docs:
+            if doc.current_file and os.path.abspath(doc.current_file) == os.path.abspath(path):
+                self._activate_tab(doc)
+                return
+
         try:
             with open(path, "r", encoding="utf-8") as f:
                 content = f.read()
-            self.text.delete("1.0", tk.END)
-            self.text.insert("1.0", content)
-            self.current_file = path
-            self.text_modified = False
-            self.title(f"MAAD Editor (Python) - {os.path.basename(path)}")
-            self.status.config(text=f"Aberto: {path}")
         except Exception as e:
             messagebox.showerror("Erro ao abrir", str(e))
+            return
+
+        if not self._active_tab_is_blank():
+            self.new_tab()
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", content)
+        self.text.edit_reset()
+        self.text.edit_modified(False)
+        self.current_file = path
+        self.text_modified = False
+        self._update_title()
+        self.status.config(text=f"Aberto: {path}")
 
-    def save_file(self):
+    def save_file(self, wait: bool = False):
+        """
+        Salva o arquivo da aba atual.
+        - wait=False: grava em segundo plano (o texto é copiado antes)
+        - wait=True: grava já e devolve o resultado (usado antes de fechar)
+        Recusa gravar uma aba bloqueada (conteúdo ainda no snapshot).
+        """
+        if self.active_doc.snapshot_path is not None:
+            messagebox.showerror("Erro ao salvar", "O conteúdo desta aba não pôde ser recarregado; nada foi gravado.")
+            return False
         if self.current_file is None:
-            return self.save_file_as()
-        try:
-            content = self.text.get("1.0", tk.END)
-            with open(self.current_file, "w", encoding="utf-8") as f:
-                f.write(content.rstrip("\n"))
-            self.text_modified = False
-            self.status.config(text=f"Salvo: {self.current_file}")
+            return self.save_file_as(wait=wait)
+        doc = self.active_doc
+        path = doc.current_file
+        content = doc.text.get("1.0", tk.END).rstrip("\n")
+
+        if wait:
+            try:
+                with self._save_lock:
+                    doc.save_seq += 1
+                    write_text_file(path, content)
+                    doc.save_failed = False
+                self._set_modified(doc, False)
+                self.status.config(text=f"Salvo: {path}")
+                return True
+            except Exception as e:
+                messagebox.showerror("Erro ao salvar", str(e))
+                return False
+
+        doc.save_seq += 1
+        seq = doc.save_seq
+        self._set_modified(doc, False)
+        self.status.config(text=f"Salvando: {path}…")
+        doc.save_job = self.jobs.submit(
+            self._save_worker, doc, path, content, seq,
+            priority=PRIORITY_HIGH, name="salvar",
+            on_done=lambda saved: saved and self.status.config(text=f"Salvo: {path}"),
+            on_error=lambda e: self._on_save_error(doc, e),
+        )
+        return True
+
+    def _save_worker(self, job, doc, path, content, seq):
+        with self._save_lock:
+            # um salvamento mais novo desta aba já foi pedido: este fica obsoleto
+            if seq != doc.save_seq:
+                return False
+            try:
+                write_text_file(path, content)
+            except Exception:
+                # on_error só roda no thread do Tk; on_exit confere esta marca
+                doc.save_failed = True
+                raise
+            doc.save_failed = False
             return True
-        except Exception as e:
-            messagebox.showerror("Erro ao salvar", str(e))
-            return False
 
-    def save_file_as(self):
+    def _on_save_error(self, doc, error):
+        self._set_modified(doc, True)
+        self.status.config(text="Erro ao salvar.")
+        messagebox.showerror("Erro ao salvar", str(error))
+
+    def _wait_for_saves(self, timeout: float = 10.0):
+        """
+        Espera os salvamentos em segundo plano terminarem (antes de sair).
+        Devolve as abas cuja gravação falhou ou não terminou no prazo.
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if all(d.save_job is None or d.save_job.done for d in self.docs):
+                break
+            time.sleep(0.02)
+        return [d for d in self.docs
+                if d.save_failed or (d.save_job is not None and not d.save_job.done)]
+
+    def save_file_as(self, wait: bool = False):
         path = filedialog.asksaveasfilename(
             title="Salvar como",
             defaultextension=".txt",
@@ -727,77 +2767,172 @@ class MAADLikeEditor(tk.Tk):
         if not path:
             return False
         self.current_file = path
-        ok = self.save_file()
-        if ok:
-            self.title(f"MAAD Editor (Python) - {os.path.basename(path)}")
-        return ok
+        return self.save_file(wait=wait)
+
+    def _export_title(self) -> str:
+        if self.current_file:
+            return os.path.splitext(os.path.basename(self.current_file))[0]
+        return "Documento"
+
+    def _make_export_writer(self, writer_cls, path, title):
+        if writer_cls is PdfExportWriter:
+            return PdfExportWriter(path, title, layout_cache=self.pdf_layout_cache)
+        return writer_cls(path, title)
+
+    def _export_with(self, writers, on_success=None):
+        """
+        Exporta o documento para um ou mais escritores numa única passada.
+        Os trechos são lidos do Text aos blocos (thread do Tk, um bloco por ciclo)
+        e passados por uma fila limitada à gravação, que roda em segundo plano.
+        Se o texto for editado antes de terminar a leitura, a exportação é
+        cancelada (a saída nunca mistura duas versões do documento).
+        Uma exportação nova cancela a anterior e só começa quando ela terminar.
+        """
+        doc = self.active_doc
+        if doc.snapshot_path is not None:
+            messagebox.showerror("Erro ao exportar", "O conteúdo desta aba não pôde ser recarregado.")
+            return
+        self._start_export(doc, writers, on_success)
+
+    def _start_export(self, doc, writers, on_success):
+        if self.export_job is not None and not self.export_job.done:
+            self.export_job.cancel()
+            self.after(20, self._start_export, doc, writers, on_success)
+            return
+        if doc not in self.docs:
+            # a aba foi fechada enquanto a exportação anterior terminava
+            return
+
+        self.export_doc = doc
+        text_widget = doc.text
+        last_line = int(text_widget.index("end-1c").split(".")[0])
+        chunks = queue.Queue(maxsize=EXPORT_QUEUE_CHUNKS)
+        self.pdf_layout_cache.reset_stats()
+        self.status.config(text="Exportando…")
+        self.export_job = self.jobs.submit(
+            self._export_worker, chunks, writers, last_line,
+            priority=PRIORITY_NORMAL, name="exportar",
+            on_done=lambda _: self._on_export_done(writers, on_success),
+            on_error=lambda e: messagebox.showerror("Erro ao exportar", str(e)),
+            on_progress=lambda fraction, message: self.status.config(text=f"Exportando… {int(fraction * 100)}%"),
+        )
+        self._feed_export(self.export_job, doc, doc.edit_seq, iter_styled_runs(text_widget), chunks)
+
+    def _feed_export(self, job, doc, edit_seq, runs, chunks, line: int = 0):
+        """
+        Lê o próximo bloco de linhas do Text e põe na fila da exportação.
+        Com a fila cheia, tenta de novo no ciclo seguinte, sem travar a interface.
+        """
+        if job.done or job.cancelled:
+            return
+        if doc.edit_seq != edit_seq:
+            job.cancel()
+            self.status.config(text="Exportação cancelada: o texto mudou.")
+            messagebox.showwarning("Exportar", "O texto foi alterado durante a exportação.\nExporte novamente.")
+            return
+        if chunks.full():
+            self.after(16, self._feed_export, job, doc, edit_seq, runs, chunks, line)
+            return
+        block = []
+        lines_read = 0
+        try:
+            for run in runs:
+                block.append(run)
+                if run is PARAGRAPH_BREAK:
+                    line += 1
+                    lines_read += 1
+                    if lines_read >= EXPORT_CHUNK_LINES:
+                        break
+            else:
+                chunks.put_nowait((block, line, True))
+                return
+        except tk.TclError as e:
+            # ex.: a aba foi fechada no meio da exportação
+            chunks.put_nowait(e)
+            return
+        chunks.put_nowait((block, line, False))
+        self.after(1, self._feed_export, job, doc, edit_seq, runs, chunks, line)
+
+    def _export_worker(self, job, chunks, writers, last_line):
+        def feed():
+            while True:
+                try:
+                    item = chunks.get(timeout=0.1)
+                except queue.Empty:
+                    job.token.raise_if_cancelled()
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                block, line, finished = item
+                job.token.raise_if_cancelled()
+                job.progress(line / max(1, last_line))
+                yield from block
+                if finished:
+                    return
+
+        export_runs(feed(), writers)
+
+    def _on_export_done(self, writers, on_success=None):
+        paths = ", ".join(w.path for w in writers)
+        msg = f"Exportado: {paths}"
+        if any(isinstance(w, PdfExportWriter) for w in writers):
+            cache = self.pdf_layout_cache
+            msg += f" | Layout PDF: {cache.misses} parágrafo(s) novo(s), {cache.hits} do cache"
+        self.status.config(text=msg)
+        if on_success is not None:
+            on_success()
+
+    def _export_single(self, writer_cls):
+        path = filedialog.asksaveasfilename(
+            title=f"Exportar {writer_cls.label}",
+            defaultextension=writer_cls.extension,
+            filetypes=[(writer_cls.label, "*" + writer_cls.extension)]
+        )
+        if not path:
+            return
+        self._export_with(
+            [self._make_export_writer(writer_cls, path, self._export_title())],
+            on_success=lambda: messagebox.showinfo(writer_cls.label, f"{writer_cls.label} exportado com sucesso!"),
+        )
 
     def export_pdf(self):
         if not REPORTLAB_OK:
             messagebox.showwarning("PDF", "Instale: pip install reportlab")
             return
+        self._export_single(PdfExportWriter)
+
+    def export_html(self):
+        self._export_single(HtmlExportWriter)
+
+    def export_epub(self):
+        self._export_single(EpubExportWriter)
+
+    def export_docx(self):
+        self._export_single(DocxExportWriter)
 
+    def export_all_formats(self):
+        """
+        Exporta PDF (se houver reportlab), HTML, EPUB e DOCX de uma vez,
+        com o mesmo nome base e percorrendo o texto uma única vez.
+        """
         path = filedialog.asksaveasfilename(
-            title="Exportar PDF",
-            defaultextension=".pdf",
-            filetypes=[("PDF", "*.pdf")]
+            title="Exportar em todos os formatos (nome base)",
+            filetypes=[("Todos", "*.*")]
         )
         if not path:
             return
-
-        text_value = self.text.get("1.0", tk.END).rstrip("\n")
-        try:
-            c = canvas.Canvas(path, pagesize=A4)
-            width, height = A4
-            margin = 50
-            y = height - margin
-            c.setFont("Helvetica", 12)
-
-            max_width = width - 2 * margin
-
-            def draw_line(line, y_pos):
-                c.drawString(margin, y_pos, line)
-
-            for raw_line in text_value.splitlines():
-                line = raw_line
-                while True:
-                    if c.stringWidth(line, "Helvetica", 12) <= max_width:
-                        if y < margin:
-                            c.showPage()
-                            c.setFont("Helvetica", 12)
-                            y = height - margin
-                        draw_line(line, y)
-                        y -= 16
-                        break
-
-                    cut = max(20, int(len(line) * 0.7))
-                    while cut < len(line) and c.stringWidth(line[:cut], "Helvetica", 12) < max_width:
-                        cut += 1
-                    cut = max(1, cut - 1)
-                    chunk = line[:cut]
-
-                    if " " in chunk:
-                        cut2 = chunk.rfind(" ")
-                        if cut2 > 10:
-                            chunk = line[:cut2]
-                            line = line[cut2 + 1:]
-                        else:
-                            line = line[cut:]
-                    else:
-                        line = line[cut:]
-
-                    if y < margin:
-                        c.showPage()
-                        c.setFont("Helvetica", 12)
-                        y = height - margin
-                    draw_line(chunk, y)
-                    y -= 16
-
-            c.save()
-            self.status.config(text=f"PDF exportado: {path}")
-            messagebox.showinfo("PDF", "PDF exportado com sucesso!")
-        except Exception as e:
-            messagebox.showerror("Erro ao exportar PDF", str(e))
+        base = os.path.splitext(path)[0]
+        title = self._export_title()
+        writers = [
+            self._make_export_writer(cls, base + cls.extension, title)
+            for cls in EXPORT_WRITERS
+            if cls is not PdfExportWriter or REPORTLAB_OK
+        ]
+        labels = ", ".join(w.label for w in writers)
+        self._export_with(
+            writers,
+            on_success=lambda: messagebox.showinfo("Exportar", f"Exportado com sucesso: {labels}"),
+        )
 
     # ---------------- About / Exit ----------------
     def show_about(self):
@@ -826,11 +2961,30 @@ class MAADLikeEditor(tk.Tk):
 
     def on_exit(self):
         self.tts_stop()
-        if not self._confirm_save_if_modified():
-            return
+        for doc in list(self.docs):
+            if doc.text_modified:
+                self._activate_tab(doc)
+                if not self._confirm_save_if_modified():
+                    return
+        # o erro de um salvamento em segundo plano não seria mais mostrado
+        # (a fila do Tk para no shutdown): grava de novo aqui e avisa
+        for doc in self._wait_for_saves():
+            if doc.text_modified:
+                continue  # o usuário escolheu não salvar esta aba
+            self._activate_tab(doc)
+            if not self.save_file(wait=True):
+                return
+        if self.tts_engine:
+            self.tts_engine.shutdown()
+        if self._spill_after_id is not None:
+            self.after_cancel(self._spill_after_id)
+        if self.spill_dir is not None:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+        self.jobs.shutdown()
         self.destroy()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = MAADLikeEditor()
     app.mainloop()
@@ -0,0 +1,186 @@
+"""
+Contadores do documento (DocumentStats) e a atualização incremental
+feita pelo proxy Tcl do Text (insert/delete/replace).
+Não precisa de tela: o Text é simulado por um comando Tcl em Python.
+"""
+import os
+import random
+import sys
+import tkinter
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import maad_editor as m  # noqa: E402
+
+
+class FakeText:
+    """
+    Texto em memória com a semântica de índices do Tk usada pelo editor:
+    "l.c", "l.end", "end", "end-1c" e "<índice> + 1c".
+    Como no Tk, o conteúdo sempre termina com "\\n".
+    """
+
+    def __init__(self):
+        self.buf = "\n"
+
+    def _offset(self, idx: str) -> int:
+        if idx.endswith(" + 1c"):
+            return min(self._offset(idx[:-5]) + 1, len(self.buf) - 1)
+        if idx == "end":
+            return len(self.buf)
+        if idx == "end-1c":
+            return len(self.buf) - 1
+        line, col = idx.split(".")
+        lines = self.buf.split("\n")
+        line = int(line)
+        if line > len(lines) - 1:
+            return len(self.buf) - 1
+        start = sum(len(x) + 1 for x in lines[:line - 1])
+        width = len(lines[line - 1])
+        return start + (width if col == "end" else min(int(col), width))
+
+    def _index(self, offset: int) -> str:
+        head = self.buf[:offset]
+        return f"{head.count(chr(10)) + 1}.{len(head) - head.rfind(chr(10)) - 1}"
+
+    def __call__(self, cmd, *args):
+        if cmd == "index":
+            if args[0] == "sel.first":
+                raise tkinter.TclError('text doesn\'t contain any characters tagged with "sel"')
+            return self._index(self._offset(args[0]))
+        if cmd == "get":
+            return self.buf[self._offset(args[0]):self._offset(args[1])]
+        if cmd == "insert":
+            at = min(self._offset(args[0]), len(self.buf) - 1)
+            self.buf = self.buf[:at] + args[1] + self.buf[at:]
+            return ""
+        if cmd == "delete":
+            a = self._offset(args[0])
+            b = self._offset(args[1]) if len(args) > 1 else a + 1
+            b = min(b, len(self.buf) - 1)
+            if b > a:
+                self.buf = self.buf[:a] + self.buf[b:]
+            return ""
+        raise tkinter.TclError(f"comando não simulado: {cmd}")
+
+
+class _Doc:
+    """
+    Só o que os métodos de estatística usam de DocumentTab.
+    """
+
+    def __init__(self, widget_name: str):
+        self.text = type("W", (), {"_w": widget_name})()
+        self.stats = m.DocumentStats()
+        self.suspend_stats = False
+        self.pending_edit = None
+        self.edit_seq = 0
+
+
+class _Editor:
+    """
+    Editor mínimo: só os métodos do MAADLikeEditor que instalam o proxy
+    e mantêm os contadores, ligados a um interpretador Tcl sem janela.
+    """
+
+    def __init__(self):
+        self.tcl = tkinter.Tcl()
+        self.tk = self.tcl.tk
+        self.active_doc = None
+        for name in ("_install_text_proxy", "_text_last_line", "_edit_line_range",
+                     "_stats_before_edit", "_stats_after_edit"):
+            setattr(self, name, getattr(m.MAADLikeEditor, name).__get__(self))
+
+    def register(self, fn):
+        name = f"py{id(fn)}"
+        self.tcl.createcommand(name, fn)
+        return name
+
+    def _schedule_stats_refresh(self):
+        pass
+
+
+def full_count(text: str):
+    stats = m.DocumentStats()
+    stats.add(text)
+    return stats.words, stats.chars, stats.sentences
+
+
+class DocumentStatsTest(unittest.TestCase):
+    def test_counts(self):
+        stats = m.DocumentStats()
+        stats.add("Olá mundo. Tudo bem?\nSim; guarda-chuva!")
+        self.assertEqual(stats.words, 6)
+        self.assertEqual(stats.chars, 38)
+        self.assertEqual(stats.sentences, 4)
+
+    def test_subtract_restores_zero(self):
+        stats = m.DocumentStats()
+        stats.add("Uma frase. Outra.")
+        stats.add("Uma frase. Outra.", -1)
+        self.assertEqual((stats.words, stats.chars, stats.sentences), (0, 0, 0))
+
+    def test_reading_minutes(self):
+        stats = m.DocumentStats()
+        stats.add("palavra " * 300)
+        self.assertAlmostEqual(stats.reading_minutes(150), 2.0)
+
+
+class IncrementalStatsTest(unittest.TestCase):
+    def setUp(self):
+        self.editor = _Editor()
+        self.fake = FakeText()
+        self.editor.tcl.createcommand(".t", self.fake)
+        self.doc = _Doc(".t")
+        self.editor.active_doc = self.doc
+        self.editor._install_text_proxy(self.doc)
+
+    def call(self, *args):
+        return self.editor.tcl.call(".t", *args)
+
+    def assert_matches_full_count(self):
+        text = str(self.call("get", "1.0", "end-1c"))
+        st = self.doc.stats
+        self.assertEqual((st.words, st.chars, st.sentences), full_count(text), repr(text))
+
+    def test_join_lines_with_single_index_delete(self):
+        # <BackSpace> no início da linha / <Delete> no fim: "delete índice" apaga o "\n"
+        self.call("insert", "1.0", "hello\nworld")
+        self.call("delete", "1.5")
+        self.assertEqual(self.fake.buf, "helloworld\n")
+        self.assert_matches_full_count()
+        # o desfazer reinsere a quebra
+        self.call("insert", "1.5", "\n")
+        self.assert_matches_full_count()
+
+    def test_errors_reach_the_caller(self):
+        with self.assertRaises(tkinter.TclError):
+            self.call("index", "sel.first")
+
+    def test_random_edits_match_full_recount(self):
+        rng = random.Random(1)
+        words = ["olá", "mundo.", "teste", "frase!", "\n", "a-b", "x;", "  ", "\n\n", "fim?"]
+        for _ in range(3000):
+            n = len(str(self.call("get", "1.0", "end-1c")))
+            r = rng.random()
+            if r < 0.55 or n == 0:
+                at = self.fake._index(rng.randint(0, n))
+                self.call("insert", at, " ".join(rng.choices(words, k=rng.randint(1, 6))))
+            elif r < 0.75:
+                self.call("delete", self.fake._index(rng.randint(0, n - 1)))
+            else:
+                a = rng.randint(0, n)
+                b = rng.randint(a, min(n, a + 30))
+                self.call("delete", self.fake._index(a), self.fake._index(b))
+            self.assert_matches_full_count()
+
+    def test_suspended_edits_are_not_counted(self):
+        self.doc.suspend_stats = True
+        self.call("insert", "1.0", "texto recarregado")
+        self.doc.suspend_stats = False
+        self.assertEqual(self.doc.stats.words, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
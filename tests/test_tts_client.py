@@ -0,0 +1,185 @@
+"""
+Servidor TTS em processo filho (TTSClient + tts_server_main) com o motor falso.
+"""
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import maad_editor as m  # noqa: E402
+
+
+class _Events:
+    """
+    Coleta os eventos do cliente (o `post` chama direto, no thread ouvinte).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = []
+
+    def __call__(self, event):
+        with self._lock:
+            self._items.append(event)
+
+    def all(self):
+        with self._lock:
+            return list(self._items)
+
+    def count(self):
+        with self._lock:
+            return len(self._items)
+
+    def wait_for(self, kind, since: int = 0, timeout: float = 10.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for event in self.all()[since:]:
+                if event[0] == kind:
+                    return event
+            time.sleep(0.005)
+        raise AssertionError(f"evento '{kind}' não chegou: {self.all()[since:]}")
+
+
+class TTSClientTest(unittest.TestCase):
+    def setUp(self):
+        self.events = _Events()
+        self.client = m.TTSClient("stub", post=lambda cb, *a: cb(*a), on_event=self.events)
+        self.client.start()
+        self.events.wait_for("ready")
+
+    def tearDown(self):
+        self.client.shutdown()
+
+    def kinds(self, since: int = 0):
+        return [e[0] for e in self.events.all()[since:] if e[0] != "word"]
+
+    def test_ready_lists_voices_and_default(self):
+        _kind, voices, default_id = self.events.wait_for("ready")
+        self.assertIn(("stub-pt", "Stub Português"), voices)
+        self.assertEqual(default_id, "stub-pt")
+
+    def test_speak_reads_every_sentence(self):
+        self.client.set_rate(3000)
+        self.client.speak(["Uma frase.", "Outra frase.", "Fim."], 0)
+        self.events.wait_for("finished")
+        sentences = [e[1] for e in self.events.all() if e[0] == "sentence"]
+        self.assertEqual(sentences, [0, 1, 2])
+
+    def test_pause_and_resume(self):
+        self.client.set_rate(600)
+        self.client.speak(["palavra " * 50, "Fim."], 0)
+        self.events.wait_for("word")
+        self.client.pause()
+        self.assertEqual(self.events.wait_for("paused")[1], 0)
+        mark = self.events.count()
+        time.sleep(0.3)
+        self.assertNotIn("word", [e[0] for e in self.events.all()[mark:]])
+        self.client.set_rate(6000)
+        self.client.resume()
+        self.events.wait_for("finished", since=mark)
+
+    def test_stop_interrupts_long_sentence(self):
+        self.client.set_rate(600)
+        self.client.speak(["longa " * 2000], 0)
+        self.events.wait_for("word")
+        mark = self.events.count()
+        start = time.monotonic()
+        self.client.stop()
+        self.events.wait_for("stopped", since=mark)
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_stop_between_sentences_is_not_lost(self):
+        self.client.set_rate(6000)
+        pid = self.client._proc.pid
+        for i in range(100):
+            self.client.speak(["curta."] * 3 + ["longa " * 2000], 0)
+            time.sleep(0.001 * (i % 7))
+            mark = self.events.count()
+            start = time.monotonic()
+            self.client.stop()
+            self.events.wait_for("stopped", since=mark)
+            self.assertLess(time.monotonic() - start, m.TTSClient.stop_timeout)
+        self.assertEqual(self.client._proc.pid, pid)
+        self.assertNotIn("restarted", self.kinds())
+
+    @unittest.skipUnless(hasattr(signal, "SIGKILL"), "precisa de SIGKILL")
+    def test_restart_after_crash_resumes_current_sentence(self):
+        self.client.set_rate(120)
+        self.client.speak(["Primeira frase.", "Segunda frase aqui.", "Terceira."], 0)
+        self.events.wait_for("sentence")
+        mark = self.events.count()
+        current = self.client._idx
+        os.kill(self.client._proc.pid, signal.SIGKILL)
+        self.events.wait_for("restarted", since=mark)
+        resumed = self.events.wait_for("sentence", since=mark)
+        self.assertEqual(resumed[1], current)
+        self.client.set_rate(6000)
+        self.events.wait_for("finished", since=mark)
+
+
+class _GatedStubEngine(m.StubSpeechEngine):
+    """
+    Motor falso que segura cada frase na entrada de speak() até o teste liberar:
+    simula um stop que chega entre duas frases.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.gate = threading.Event()
+
+    def speak(self, text, on_word):
+        self.entered.set()
+        self.gate.wait(5.0)
+        return super().speak(text, on_word)
+
+
+class ServerInterruptTest(unittest.TestCase):
+    """
+    tts_server_main num thread deste processo, com o motor controlado pelo teste.
+    """
+
+    def setUp(self):
+        self.engine = _GatedStubEngine()
+        self._orig_make = m.make_speech_engine
+        m.make_speech_engine = lambda name: self.engine
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.server = threading.Thread(target=m.tts_server_main, args=(child_conn, "stub"), daemon=True)
+        self.server.start()
+        self.assertEqual(self.recv_until("ready")[0], "ready")
+
+    def tearDown(self):
+        self.engine.gate.set()
+        self.conn.send(("quit",))
+        self.server.join(2.0)
+        m.make_speech_engine = self._orig_make
+
+    def recv_until(self, kind, timeout: float = 2.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self.conn.poll(0.05):
+                msg = self.conn.recv()
+                if msg[0] == kind:
+                    return msg
+        raise AssertionError(f"evento '{kind}' não chegou")
+
+    def test_stop_before_speak_starts_is_not_lost(self):
+        self.conn.send(("rate", 600))
+        self.conn.send(("speak", ["longa " * 2000], 0))
+        self.assertTrue(self.engine.entered.wait(2.0))
+        self.conn.send(("stop",))
+        deadline = time.monotonic() + 2.0
+        while not self.engine._stop.is_set() and time.monotonic() < deadline:
+            time.sleep(0.005)
+        self.engine.gate.set()
+        # sem a correção, a frase inteira (~200 s) seria falada antes do "stopped"
+        self.recv_until("stopped", timeout=1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""
+Catálogo de vozes do TTS (VoiceCatalog).
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import maad_editor as m  # noqa: E402
+
+
+class VoiceCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "sub", "voices-stub.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_duplicate_names_get_unique_labels(self):
+        catalog = m.VoiceCatalog(self.path)
+        catalog.update([("v1", "Microsoft Maria"), ("v2", "Microsoft Maria"), ("v3", "Daniel")], "v3")
+        labels = catalog.labels()
+        self.assertEqual(labels, ["Microsoft Maria (v1)", "Microsoft Maria (v2)", "Daniel"])
+        self.assertEqual([catalog.resolve(label) for label in labels], ["v1", "v2", "v3"])
+        self.assertEqual(catalog.resolve("(padrão)"), "v3")
+        self.assertIsNone(catalog.resolve("Inexistente"))
+
+    def test_update_reports_changes(self):
+        catalog = m.VoiceCatalog(self.path)
+        self.assertTrue(catalog.update([("v1", "A")], "v1"))
+        self.assertFalse(catalog.update([("v1", "A")], "v1"))
+        self.assertTrue(catalog.update([("v1", "A"), ("v2", "B")], "v1"))
+
+    def test_save_and_load(self):
+        catalog = m.VoiceCatalog(self.path)
+        catalog.update([("v1", "Maria"), ("v2", "Maria")], "v2")
+        catalog.save()
+        loaded = m.VoiceCatalog(self.path)
+        self.assertTrue(loaded.load())
+        self.assertEqual(loaded.labels(), catalog.labels())
+        self.assertEqual(loaded.default_id, "v2")
+        self.assertFalse(loaded.update(catalog.voices, "v2"))
+
+    def test_load_missing_file(self):
+        self.assertFalse(m.VoiceCatalog(self.path).load())
+
+
+if __name__ == "__main__":
+    unittest.main()